@@ -1,6 +1,8 @@
 import json
 import logging
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -9,6 +11,9 @@ logger = logging.getLogger(__name__)
 # Load environment variables from .env file
 load_dotenv()
 
+# Characters stripped by Config.safe_title (same set as isalnum() plus " -_")
+_UNSAFE_TITLE_RE = re.compile(r"[^\w \-]")
+
 def _load_settings_file() -> dict:
     """Load settings overrides from output/settings.json if it exists."""
     settings_path = Path(__file__).resolve().parent.parent / "output" / "settings.json"
@@ -46,6 +51,10 @@ class Config:
     FINAL_DIR = OUTPUT_DIR / "final"
     LOGS_DIR = OUTPUT_DIR / "pipeline_logs"
     PROJECTS_DIR = OUTPUT_DIR / "projects"
+    SCRIPT_CACHE_DIR = OUTPUT_DIR / "script_cache"
+    TTS_CACHE_DIR = OUTPUT_DIR / "tts_cache"
+    IMAGE_CLIP_CACHE_DIR = OUTPUT_DIR / "image_clip_cache"
+    PROBE_CACHE_FILE = OUTPUT_DIR / "probe_cache.json"
     SETTINGS_FILE = OUTPUT_DIR / "settings.json"
 
     # Load API keys (settings file overrides .env)
@@ -60,6 +69,20 @@ class Config:
     VEO_MODEL = _models.get("video_model") or os.getenv("VEO_MODEL", "veo-3.1-lite-generate-preview")
     TTS_MODEL = _models.get("tts_model") or os.getenv("TTS_MODEL", "gemini-2.5-flash-preview-tts")
 
+    # Seconds to wait on Gemini before racing a Groq request for the script
+    LLM_HEDGE_DELAY = float(os.getenv("LLM_HEDGE_DELAY", "20"))
+    # Wall-clock limit (seconds) for a single script generation request
+    LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "120"))
+
+    # CTranslate2 compute type for Whisper; empty picks float16 on CUDA, int8 on CPU
+    WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE", "")
+
+    # libx264 preset for the final render / re-encode fallbacks (CRF stays 23)
+    X264_PRESET = os.getenv("X264_PRESET", "faster")
+
+    # Upper bound on concurrent FFmpeg encodes per render step; 0 sizes from the CPU count
+    FFMPEG_MAX_PARALLEL = int(os.getenv("FFMPEG_MAX_PARALLEL", "0"))
+
     # Google Cloud Vertex AI (for Veo 3.1 animated pipeline)
     VERTEX_PROJECT_ID = _get("VERTEX_PROJECT_ID")
     VERTEX_LOCATION = _get("VERTEX_LOCATION") or "us-central1"
@@ -82,9 +105,10 @@ class Config:
     )
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def safe_title(name: str) -> str:
         """Sanitize a string for use in file/directory names."""
-        return "".join(c for c in name if c.isalnum() or c in " -_").strip().replace(" ", "_")
+        return _UNSAFE_TITLE_RE.sub("", name).strip().replace(" ", "_")
 
     @classmethod
     def validate(cls, mode: str = "movie"):
@@ -148,6 +172,8 @@ class Config:
         cls.FINAL_DIR.mkdir(parents=True, exist_ok=True)
         cls.LOGS_DIR.mkdir(parents=True, exist_ok=True)
         cls.PROJECTS_DIR.mkdir(parents=True, exist_ok=True)
+        cls.TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cls.IMAGE_CLIP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 # Run validation on import to ensure fail-fast behavior if preferred,
 # or let the main application call Config.validate()
@@ -20,6 +20,7 @@ import time
 from pathlib import Path
 from typing import Tuple, Optional
 
+import numpy as np
 from google import genai
 from google.genai import types
 from google.genai.errors import ClientError, ServerError as GenAIServerError
@@ -100,6 +101,14 @@ VOICE_MAPPING = {
 # Default voice for narration
 DEFAULT_VOICE = 'Zephyr'
 
+# Gemini TTS output format: 24kHz, 16-bit mono PCM
+TTS_SAMPLE_RATE = 24000
+
+# Leading/trailing padding quieter than this (about -40 dBFS) is dropped,
+# keeping a short margin so word onsets are not clipped
+SILENCE_THRESHOLD = 328
+SILENCE_MARGIN_SECONDS = 0.05
+
 # Mood to style prompt mapping for expressive delivery
 MOOD_STYLE_PROMPTS = {
     'tense': 'Speak with tension and urgency in your voice.',
@@ -173,6 +182,28 @@ def _build_style_prompt(mood: Optional[str] = None) -> str:
     return MOOD_STYLE_PROMPTS['neutral']
 
 
+def _trim_silence(pcm_data: bytes, rate: int = TTS_SAMPLE_RATE) -> bytes:
+    """
+    Drop leading and trailing silence from 16-bit mono PCM.
+
+    Args:
+        pcm_data: Raw PCM audio bytes
+        rate: Sample rate in Hz
+
+    Returns:
+        The trimmed PCM bytes, or pcm_data unchanged if it is all silence.
+    """
+    samples = np.frombuffer(pcm_data, dtype=np.int16, count=len(pcm_data) // 2)
+    voiced = np.flatnonzero(np.abs(samples.astype(np.int32)) > SILENCE_THRESHOLD)
+    if voiced.size == 0:
+        return pcm_data
+
+    margin = int(SILENCE_MARGIN_SECONDS * rate)
+    start = max(0, int(voiced[0]) - margin)
+    end = min(samples.size, int(voiced[-1]) + 1 + margin)
+    return pcm_data[start * 2:end * 2]
+
+
 def _write_wave_file(filename: str, pcm_data: bytes, channels: int = 1,
                      rate: int = 24000, sample_width: int = 2) -> None:
     """
@@ -376,11 +407,17 @@ def generate_audio(
                 logger.warning(f"TTS attempt ({attempt_name}) returned empty/blocked response, will try sanitized if available...")
                 continue
 
+            # Strip the padding Gemini adds around speech before it reaches
+            # the WAV, so scene timing and every later read skip it for free
+            untrimmed_length = len(audio_data)
+            audio_data = _trim_silence(audio_data)
+            logger.debug(f"Trimmed {(untrimmed_length - len(audio_data)) / (TTS_SAMPLE_RATE * 2):.2f}s of silence")
+
             # Write to WAV file
             _write_wave_file(output_path, audio_data)
 
             # Calculate duration (24kHz, 16-bit mono)
-            duration_seconds = len(audio_data) / (24000 * 2 * 1)
+            duration_seconds = len(audio_data) / (TTS_SAMPLE_RATE * 2 * 1)
 
             logger.info(f"TTS complete ({attempt_name}): {output_path} ({duration_seconds:.2f}s)")
             return output_path, max(0.1, duration_seconds)
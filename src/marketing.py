@@ -4,7 +4,6 @@ Marketing utilities for generating social media captions.
 
 import logging
 import groq
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from src.config import Config
 from src.narrative import VideoScript
@@ -41,18 +40,8 @@ class CaptionGenerator:
     """
 
     def __init__(self):
-        """Initialize the Groq client."""
-        self.client = groq.Groq(api_key=Config.GROQ_API_KEY)
-
-    @retry(
-        retry=retry_if_exception_type((groq.RateLimitError, groq.APIConnectionError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
-    def _generate_with_retry(self, **kwargs) -> str:
-        """Wraps the Groq API call with retry logic."""
-        response = self.client.chat.completions.create(**kwargs)
-        return response.choices[0].message.content.strip()
+        """Initialize the Groq client (SDK retries honor the server's Retry-After header)."""
+        self.client = groq.Groq(api_key=Config.GROQ_API_KEY, max_retries=5, timeout=30.0)
 
     def _get_hashtags_for_genre(self, genre: str) -> list[str]:
         """Get relevant hashtags based on movie genre."""
@@ -61,9 +50,8 @@ class CaptionGenerator:
 
     def _extract_narration_summary(self, script: VideoScript) -> str:
         """Extract a brief summary from the script's narration."""
-        # Combine first two scenes for context (hook + setup)
-        narrations = [scene.narration for scene in script.scenes[:2]]
-        return " ".join(narrations)
+        # First two scenes for context (hook + setup), precomputed on the script
+        return script.hook_context
 
     def generate_social_caption(self, script: VideoScript) -> str:
         """
@@ -113,7 +101,7 @@ DO NOT include hashtags - I will add them separately.
 DO NOT add any explanation or commentary - just the caption."""
 
         try:
-            caption_body = self._generate_with_retry(
+            response = self.client.chat.completions.create(
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
@@ -122,6 +110,7 @@ DO NOT add any explanation or commentary - just the caption."""
                 temperature=0.8,
                 max_tokens=200
             )
+            caption_body = response.choices[0].message.content.strip()
 
             # Add hashtags
             hashtags = genre_hashtags + ["#movierecap", "#films"]
@@ -133,6 +122,9 @@ DO NOT add any explanation or commentary - just the caption."""
             logger.info(f"Generated caption for '{script.title}' ({script.genre})")
             return full_caption
 
+        except groq.APIStatusError as e:
+            logger.error(f"Failed to generate caption (Groq status {e.status_code}): {e.message}")
+            raise
         except Exception as e:
             logger.error(f"Failed to generate caption: {e}")
             raise
@@ -1,3 +1,7 @@
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import unicodedata
 import wikipediaapi
 import requests
 import logging
@@ -8,6 +12,18 @@ logger = logging.getLogger(__name__)
 # TMDB image base URL - use original size for high quality
 TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p/original"
 
+# Process-wide cache of TMDB search hits, keyed by normalized query
+_SEARCH_CACHE: dict[str, dict] = {}
+_search_cache_lock = threading.Lock()
+
+# Shared, bounded pool for TMDB searches raced against the Wikipedia lookup
+_tmdb_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tmdb-search")
+
+
+def _normalize_query(query: str) -> str:
+    """Normalize a search query so trivially different spellings share a cache key."""
+    return " ".join(unicodedata.normalize("NFKD", query).lower().split())
+
 class MovieDBClient:
     """
     Client for interacting with Wikipedia to fetch movie details,
@@ -25,8 +41,12 @@ class MovieDBClient:
         # Wikipedia setup
         self.wiki = wikipediaapi.Wikipedia(
             user_agent='StudioZero/1.0 (contact@example.com)',
-            language='en'
+            language='en',
+            extract_format=wikipediaapi.ExtractFormat.WIKI,
         )
+        # Page objects are cached per normalized title so repeat lookups
+        # (direct title, " (film)" suffix, plot fallback) reuse one fetch
+        self._cached_page = functools.lru_cache(maxsize=256)(self.wiki.page)
 
         # TMDB setup
         self.tmdb_api_key = tmdb_api_key
@@ -49,26 +69,47 @@ class MovieDBClient:
         """
         Search for a movie by query string.
         Prioritizes Wikipedia, falls back to TMDB if configured.
+
+        When TMDB is configured, both lookups run concurrently on a shared,
+        bounded pool so a Wikipedia miss costs max(wiki, tmdb) instead of
+        wiki + tmdb. A Wikipedia hit cancels the TMDB search if it has not
+        started; one already running lands in the search cache, so later
+        metadata lookups reuse it.
         
         Returns:
             dict | None: A result dictionary with 'source' ('wiki' or 'tmdb') and data.
         """
+        tmdb_future = None
+        if self.tmdb_session:
+            tmdb_future = _tmdb_executor.submit(self._search_tmdb, query)
+
         # 1. Try Wikipedia
-        wiki_result = self._search_wikipedia(query)
+        try:
+            wiki_result = self._search_wikipedia(query)
+        except Exception as e:
+            if tmdb_future is None:
+                raise
+            logger.warning(f"Wikipedia lookup error for '{query}': {e}")
+            wiki_result = None
+
         if wiki_result:
             logger.info(f"Movie found on Wikipedia: {wiki_result['title']}")
+            if tmdb_future is not None:
+                # Drop the TMDB search if it has not started yet; one already
+                # in flight finishes into the search cache
+                tmdb_future.cancel()
             return {"source": "wiki", "data": wiki_result}
-            
+
         # 2. Fallback to TMDB
-        if self.tmdb_session:
-            logger.info(f"Wikipedia search failed for '{query}'. Falling back to TMDB.")
-            tmdb_result = self._search_tmdb(query)
-            if tmdb_result:
-                logger.info(f"Movie found on TMDB: {tmdb_result.get('title')}")
-                return {"source": "tmdb", "data": tmdb_result}
-        else:
+        if tmdb_future is None:
             logger.warning("Wikipedia search failed and TMDB API key is not configured.")
+            return None
 
+        logger.info(f"Wikipedia search failed for '{query}'. Falling back to TMDB.")
+        tmdb_result = tmdb_future.result()
+        if tmdb_result:
+            logger.info(f"Movie found on TMDB: {tmdb_result.get('title')}")
+            return {"source": "tmdb", "data": tmdb_result}
         return None
 
     def get_movie_details(self, search_result: dict) -> dict | None:
@@ -106,14 +147,18 @@ class MovieDBClient:
 
     # --- Wikipedia Helpers ---
 
+    def _get_page(self, title: str):
+        """Return the (cached) Wikipedia page object for a title."""
+        return self._cached_page(" ".join(title.split()))
+
     def _search_wikipedia(self, query: str) -> dict | None:
         # Try direct match
-        page = self.wiki.page(query)
+        page = self._get_page(query)
         if page.exists():
             return {"title": page.title, "page_obj": page}
             
         # Try with " (film)" suffix
-        page_film = self.wiki.page(f"{query} (film)")
+        page_film = self._get_page(f"{query} (film)")
         if page_film.exists():
             return {"title": page_film.title, "page_obj": page_film}
             
@@ -121,24 +166,31 @@ class MovieDBClient:
 
     # Section headers to search for plot content (in priority order)
     PLOT_SECTION_HEADERS = ["Plot", "Synopsis", "Plot summary", "Premise"]
+    _PLOT_HEADERS_SET = frozenset(PLOT_SECTION_HEADERS)
 
-    def _get_wiki_details(self, data: dict) -> dict:
-        page = data["page_obj"]
+    # Summaries at least this long are used as the plot without scanning sections
+    MIN_SUMMARY_PLOT_CHARS = 400
 
-        plot_text = ""
-        # Try finding plot section using multiple possible headers
-        plot_section = None
-        for header in self.PLOT_SECTION_HEADERS:
-            plot_section = page.section_by_title(header)
-            if plot_section and plot_section.text.strip():
-                break
-            plot_section = None
+    def _get_wiki_details(self, data: dict, fast_plot: bool = False) -> dict:
+        """
+        Build movie details from a Wikipedia page.
+
+        The Plot section is preferred; the lede summary is used only when no
+        plot section has text. Both come from the same extract request.
 
-        if plot_section:
-            plot_text = plot_section.text
+        Args:
+            data: Search result data containing the 'page_obj'.
+            fast_plot: If True, use the page summary as the plot when it is long
+                enough, skipping the section scan. Off by default, since the
+                lede is a synopsis rather than the plot the script needs.
+        """
+        page = data["page_obj"]
+
+        summary = page.summary or ""
+        if fast_plot and len(summary) >= self.MIN_SUMMARY_PLOT_CHARS:
+            plot_text = summary
         else:
-            # Fall back to summary if no plot section found
-            plot_text = page.summary if page.summary else ""
+            plot_text = self._find_plot_section_text(page) or summary
 
         # Extract categories as a proxy for genre
         categories = []
@@ -162,9 +214,45 @@ class MovieDBClient:
             "categories": categories
         }
 
+    def _find_plot_section_text(self, page) -> str:
+        """Return the text of the highest-priority non-empty plot section, or ""."""
+        # Walk the section tree once in document order (nested sections such as
+        # "Plot" under "Synopsis" included), collecting non-empty candidates by header
+        candidates = {}
+        pending = list(reversed(page.sections))
+        while pending:
+            section = pending.pop()
+            pending.extend(reversed(section.sections))
+            if (
+                section.title in self._PLOT_HEADERS_SET
+                and section.title not in candidates
+                and section.text.strip()
+            ):
+                candidates[section.title] = section
+
+        # Pick the highest-priority header that was found
+        for header in self.PLOT_SECTION_HEADERS:
+            if header in candidates:
+                return candidates[header].text
+        return ""
+
     # --- TMDB Helpers ---
 
     def _search_tmdb(self, query: str) -> dict | None:
+        cache_key = _normalize_query(query)
+        with _search_cache_lock:
+            cached = _SEARCH_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug(f"TMDB search cache hit for '{query}'")
+            return cached
+
+        movie = self._fetch_tmdb_search(query)
+        if movie is not None:
+            with _search_cache_lock:
+                _SEARCH_CACHE[cache_key] = movie
+        return movie
+
+    def _fetch_tmdb_search(self, query: str) -> dict | None:
         url = f"{self.TMDB_BASE_URL}/search/movie"
         params = {"query": query}
         
@@ -1,13 +1,21 @@
+import hashlib
 import json
 import logging
+import math
+import re
+import threading
+import time
+from collections import Counter
 from pathlib import Path
-from typing import List, Callable, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, wait
+from typing import Dict, List, Callable, Optional, Tuple
 from datetime import datetime
+from functools import cached_property, lru_cache
 import groq
+import orjson
 from google import genai
 from google.genai import types
 from pydantic import BaseModel, Field, ValidationError
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from src.config import Config
 from src.config_mappings import (
     TTS_VOICES,
@@ -93,6 +101,122 @@ class VideoScript(BaseModel):
         description="List of exactly 6 scenes covering the full narrative arc"
     )
 
+    @cached_property
+    def hook_context(self) -> str:
+        """Narration of the first two scenes (hook + setup), joined once per script."""
+        return " ".join(scene.narration for scene in self.scenes[:2])
+
+
+class _RateLimiter:
+    """Thread-safe limiter that spaces calls evenly to stay under a requests-per-minute cap."""
+
+    def __init__(self, qpm: int):
+        self._interval = 60.0 / max(1, qpm)
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the caller may issue its request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# Plots at least this similar (cosine over word counts) reuse a cached script
+SEMANTIC_CACHE_THRESHOLD = 0.95
+
+# Only the start of the plot is compared, matching what dominates the script
+SEMANTIC_PLOT_CHARS = 2000
+
+_WORD_RE = re.compile(r"\w+")
+
+# Upper bound on plot text sent to the LLM (~3k tokens)
+MAX_PLOT_CHARS = 12_000
+_PLOT_OMISSION_MARKER = "\n...[middle omitted]...\n"
+
+
+class _SafeTitleTable(dict):
+    """str.translate table mapping non-alphanumerics to '_', filled lazily past ASCII."""
+
+    def __missing__(self, codepoint: int) -> int:
+        value = codepoint if chr(codepoint).isalnum() else ord("_")
+        self[codepoint] = value
+        return value
+
+
+_SAFE_TITLE_TABLE = _SafeTitleTable(
+    (cp, cp if chr(cp).isalnum() else ord("_")) for cp in range(128)
+)
+
+
+def _truncate_plot(plot: str, max_chars: int = MAX_PLOT_CHARS) -> str:
+    """
+    Bound plot length while keeping the setup and the ending.
+
+    Keeps the first 60% and last 30% of the budget, which preserves the hook
+    and the resolution the script has to cover.
+    """
+    if len(plot) <= max_chars:
+        return plot
+    head = int(max_chars * 0.6)
+    tail = int(max_chars * 0.3)
+    return plot[:head] + _PLOT_OMISSION_MARKER + plot[-tail:]
+
+
+def _report_log_failure(future) -> None:
+    """Done-callback for background log writes, which have no caller to raise to."""
+    error = future.exception()
+    if error is not None:
+        logger.warning(f"Failed to write video script log: {error}")
+
+
+def _plot_vector(plot: str) -> Counter:
+    """Bag-of-words vector for near-duplicate plot detection."""
+    return Counter(_WORD_RE.findall(plot[:SEMANTIC_PLOT_CHARS].lower()))
+
+
+def _cosine_similarity(a: Counter, b: Counter) -> float:
+    """Cosine similarity between two word-count vectors."""
+    if not a or not b:
+        return 0.0
+    dot = sum(count * b[word] for word, count in a.items() if word in b)
+    norm_a = math.sqrt(sum(c * c for c in a.values()))
+    norm_b = math.sqrt(sum(c * c for c in b.values()))
+    return dot / (norm_a * norm_b)
+
+
+@lru_cache(maxsize=1)
+def _get_gemini_client() -> genai.Client:
+    """Process-wide Gemini client so every StoryGenerator shares one connection pool."""
+    # Bound each request so a hung call can't stall the fallback chain (timeout is in ms)
+    return genai.Client(
+        api_key=Config.GEMINI_API_KEY,
+        http_options=types.HttpOptions(timeout=int(Config.LLM_TIMEOUT * 1000)),
+    )
+
+
+# Extra attempts when Groq rejects its own JSON output (json_validate_failed);
+# the SDK's max_retries never retries a 400
+GROQ_JSON_RETRIES = 2
+
+
+def _is_groq_json_validate_failed(error: groq.BadRequestError) -> bool:
+    """Whether a Groq 400 is the json_object mode rejecting the generated JSON."""
+    body = error.body
+    if isinstance(body, dict):
+        details = body.get("error", body)
+        return isinstance(details, dict) and details.get("code") == "json_validate_failed"
+    return False
+
+
+@lru_cache(maxsize=1)
+def _get_groq_client() -> groq.Groq:
+    """Process-wide Groq client (SDK retries honor the server's Retry-After header)."""
+    return groq.Groq(api_key=Config.GROQ_API_KEY, max_retries=5, timeout=30.0)
+
 
 # ============================================================================
 # StoryGenerator Class - Video Director
@@ -110,30 +234,68 @@ class StoryGenerator:
         - Multi-option visual queries per scene
     """
 
-    def __init__(self, log_dir: Optional[Path] = None):
+    # Cached scripts older than this are regenerated
+    SCRIPT_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+    def __init__(self, log_dir: Optional[Path] = None, cache_dir: Optional[Path] = None):
         """
         Initialize Gemini (primary) and Groq (fallback) clients.
 
         Args:
             log_dir: Directory to save results. If None, uses output/pipeline_logs/
+            cache_dir: Directory for the script response cache. If None, uses output/script_cache/
         """
-        # Primary: Gemini client
-        self.gemini_client = genai.Client(api_key=Config.GEMINI_API_KEY)
+        # Primary: Gemini client (shared across instances)
+        self.gemini_client = _get_gemini_client()
         self.gemini_model = Config.GEMINI_MODEL_NAME
 
-        # Fallback: Groq client
-        self.groq_client = groq.Groq(api_key=Config.GROQ_API_KEY)
+        # Fallback: Groq client (shared across instances)
+        self.groq_client = _get_groq_client()
 
         self.log_dir = log_dir or Config.LOGS_DIR
         self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir = cache_dir or Config.SCRIPT_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # The schema and Storyteller prompt are static - build them once.
+        # Keeping the prompt byte-identical across calls lets both Gemini and
+        # Groq reuse their provider-side prefix caches.
+        self._schema_cached = VideoScript.model_json_schema()
+        self._system_prompt = self._build_system_prompt()
+        # Groq's json_object mode has no structured schema, so it gets a compact copy inline
+        self._groq_schema_suffix = (
+            "\n\nOutput MUST be valid JSON matching this schema:\n"
+            f"{json.dumps(self._schema_cached, separators=(',', ':'))}"
+        )
+        self._prompt_digest = hashlib.blake2b(self._system_prompt.encode("utf-8"), digest_size=8).hexdigest()
+
+        # Near-duplicate lookup: title key -> [(cache key, plot vector)], loaded lazily
+        self._semantic_index: Optional[Dict[str, List[Tuple[str, Counter]]]] = None
+        self._semantic_lock = threading.Lock()
+
+        # Debug logs are written off the request path; a single worker keeps them ordered
+        self._log_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="script-log")
 
-    def _generate_with_gemini(self, system_prompt: str, user_prompt: str) -> str:
+    def close(self) -> None:
+        """Wait for pending debug log writes to finish."""
+        self._log_executor.shutdown(wait=True)
+
+    def _generate_with_gemini(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        on_chunk: Optional[Callable[[str], None]] = None,
+    ) -> str:
         """
         Generate script using Google Gemini with structured JSON output.
 
+        The response is streamed so progress can be reported while the model
+        is still decoding; the chunks are joined and returned once it closes.
+
         Args:
             system_prompt: The system instruction prompt
             user_prompt: The user's request prompt
+            on_chunk: Optional callable invoked with each streamed text chunk
 
         Returns:
             Raw JSON string response from Gemini
@@ -141,37 +303,317 @@ class StoryGenerator:
         Raises:
             Exception: On API errors (rate limit, server errors, etc.)
         """
-        # Build the combined prompt (Gemini uses a single prompt, not system/user split)
-        combined_prompt = f"{system_prompt}\n\n---\n\n{user_prompt}"
-
-        # Get the JSON schema from the Pydantic model
-        schema = VideoScript.model_json_schema()
-
-        response = self.gemini_client.models.generate_content(
+        # Send the static Storyteller prompt as the system instruction so the
+        # identical prefix is eligible for Gemini's implicit prompt caching;
+        # only the per-movie user prompt varies between calls
+        stream = self.gemini_client.models.generate_content_stream(
             model=self.gemini_model,
-            contents=combined_prompt,
+            contents=user_prompt,
             config=types.GenerateContentConfig(
+                system_instruction=system_prompt,
                 response_mime_type="application/json",
-                response_schema=schema,
+                response_schema=self._schema_cached,
             ),
         )
 
-        return response.text
+        chunks = []
+        for chunk in stream:
+            text = chunk.text
+            if text:
+                chunks.append(text)
+                if on_chunk:
+                    on_chunk(text)
 
-    @retry(
-        retry=retry_if_exception_type((groq.RateLimitError, groq.BadRequestError)),
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
-    def _generate_with_groq(self, **kwargs) -> str:
+        return "".join(chunks)
+
+    def _generate_with_groq(self, system_prompt: str, user_prompt: str) -> str:
         """
-        Generate script using Groq as fallback with retry logic.
+        Generate script using Groq (SDK-native retries).
+
+        The compact JSON schema is appended to the system prompt since Groq's
+        json_object mode doesn't take a structured schema. A generation that
+        Groq itself rejects as invalid JSON is retried up to GROQ_JSON_RETRIES
+        times; other errors are left to the SDK's own retries.
 
         Returns:
             Raw JSON string response from Groq
         """
-        response = self.groq_client.chat.completions.create(**kwargs)
-        return response.choices[0].message.content
+        for attempt in range(GROQ_JSON_RETRIES + 1):
+            try:
+                response = self.groq_client.chat.completions.create(
+                    messages=[
+                        {"role": "system", "content": system_prompt + self._groq_schema_suffix},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    model="llama-3.3-70b-versatile",
+                    response_format={"type": "json_object"}
+                )
+            except groq.BadRequestError as e:
+                if attempt < GROQ_JSON_RETRIES and _is_groq_json_validate_failed(e):
+                    logger.warning(
+                        f"Groq returned invalid JSON, retrying ({attempt + 1}/{GROQ_JSON_RETRIES})"
+                    )
+                    continue
+                logger.error(f"Groq request failed with status {e.status_code}: {e.message}")
+                raise
+            except groq.APIStatusError as e:
+                logger.error(f"Groq request failed with status {e.status_code}: {e.message}")
+                raise
+            return response.choices[0].message.content
+
+    @staticmethod
+    def _parse_script(content: str) -> VideoScript:
+        """
+        Parse and validate raw LLM JSON in one pass (pydantic-core parses JSON natively).
+
+        Raises:
+            ValueError: If the content is not valid JSON or doesn't match the schema.
+        """
+        try:
+            return VideoScript.model_validate_json(content)
+        except ValidationError as e:
+            # Malformed JSON is reported by pydantic as a json_invalid error
+            if any(err.get("type") == "json_invalid" for err in e.errors()):
+                raise ValueError(f"Failed to parse JSON response: {e}")
+            raise ValueError(f"Response doesn't match VideoScript schema: {e}")
+
+    def _generate_validated(
+        self,
+        provider: str,
+        system_prompt: str,
+        user_prompt: str,
+        callback: Callable = None,
+    ) -> Tuple[str, VideoScript]:
+        """
+        Call one provider and validate its answer.
+
+        A 200 response that is empty or doesn't match the schema is raised as
+        an error, so it triggers the fallback instead of reaching the caller.
+
+        Returns:
+            Tuple of (raw JSON content, validated VideoScript)
+        """
+        if provider == "gemini":
+            on_chunk = None
+            if callback:
+                received = 0
+
+                def on_chunk(text: str) -> None:
+                    nonlocal received
+                    received += len(text)
+                    callback('log', f"Gemini streaming script... {received} chars received")
+
+            content = self._generate_with_gemini(system_prompt, user_prompt, on_chunk=on_chunk)
+        else:
+            content = self._generate_with_groq(system_prompt, user_prompt)
+        if not content or not content.strip():
+            raise ValueError(f"{provider} returned an empty response")
+        return content, self._parse_script(content)
+
+    def _generate_content(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        callback: Callable = None,
+    ) -> Tuple[str, VideoScript, str]:
+        """
+        Get a validated script from Gemini, hedged with Groq.
+
+        Gemini is started first. If it fails - including empty or
+        schema-invalid output - Groq is called straight away. If it is still
+        running after Config.LLM_HEDGE_DELAY seconds, a Groq request is fired
+        alongside it and whichever succeeds first wins (Gemini on a tie).
+        Without a Groq key this is a plain Gemini call with the usual serial
+        fallback.
+
+        Gemini's streaming progress reaches callback from the worker thread,
+        and only until this method returns, so a losing Gemini stream stops
+        reporting once Groq has won.
+
+        Returns:
+            Tuple of (raw JSON content, validated VideoScript, provider name)
+
+        Raises:
+            RuntimeError: If both providers fail.
+        """
+        if callback:
+            callback('log', f"Attempting script generation with Gemini ({self.gemini_model})...")
+
+        hedge_delay = Config.LLM_HEDGE_DELAY if Config.GROQ_API_KEY else None
+        # Cleared on return, muting the Gemini attempt once it is no longer the active one
+        gemini_active = threading.Event()
+        gemini_active.set()
+        gemini_callback = None
+        if callback:
+            def gemini_callback(*args) -> None:
+                if gemini_active.is_set():
+                    callback(*args)
+
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            gemini_future = executor.submit(
+                self._generate_validated, "gemini", system_prompt, user_prompt, gemini_callback
+            )
+            try:
+                content, script = gemini_future.result(timeout=hedge_delay)
+                logger.info("Script generated successfully with Gemini")
+                return content, script, "gemini"
+            except FuturesTimeoutError:
+                logger.info(f"Gemini still running after {hedge_delay:.0f}s, hedging with Groq...")
+                if callback:
+                    callback('log', f"Gemini slow (>{hedge_delay:.0f}s), racing Groq fallback...")
+            except Exception as e:
+                # Gemini failed or returned an unusable response - fall back to Groq
+                logger.warning(f"[WARN] Gemini failed: {e}. Switching to Groq fallback...")
+                if callback:
+                    callback('log', f"[WARN] Gemini failed: {e}. Switching to Groq fallback...")
+                    callback('log', "Attempting script generation with Groq fallback...")
+                try:
+                    content, script = self._generate_validated("groq", system_prompt, user_prompt)
+                except Exception as groq_error:
+                    raise RuntimeError(f"Both Gemini and Groq failed. Last error: {groq_error}")
+                logger.info("Script generated successfully with Groq fallback")
+                return content, script, "groq"
+
+            # Hedged race: first successful provider wins
+            groq_future = executor.submit(self._generate_validated, "groq", system_prompt, user_prompt)
+            providers = {gemini_future: "gemini", groq_future: "groq"}
+            pending = set(providers)
+            last_error = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: providers[f] != "gemini"):
+                    error = future.exception()
+                    if error is None:
+                        logger.info(f"Script generated successfully with {providers[future]} (hedged)")
+                        content, script = future.result()
+                        return content, script, providers[future]
+                    logger.warning(f"[WARN] {providers[future]} failed during hedged race: {error}")
+                    last_error = error
+            raise RuntimeError(f"Both Gemini and Groq failed. Last error: {last_error}")
+        finally:
+            # Don't wait for the losing request, and stop relaying its progress
+            gemini_active.clear()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def script_cache_key(self, movie_title: str, plot: str) -> str:
+        """
+        Content hash identifying a script request.
+
+        The system prompt is part of the key so prompt edits never serve
+        scripts written against an older prompt.
+        """
+        payload = "\x1f".join((movie_title, plot, self._system_prompt))
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cache_path(self, key: str) -> Path:
+        """Path of the cache file for a key."""
+        return self.cache_dir / f"vscript_{key}.json"
+
+    def _meta_path(self, key: str) -> Path:
+        """Path of the sidecar used by the near-duplicate index."""
+        return self.cache_dir / f"vscript_{key}.meta.json"
+
+    def _title_key(self, movie_title: str) -> str:
+        """Index bucket for a title under the current system prompt."""
+        return f"{' '.join(movie_title.lower().split())}\x1f{self._prompt_digest}"
+
+    def _get_semantic_index(self) -> Dict[str, List[Tuple[str, Counter]]]:
+        """Build the near-duplicate index from cache sidecars on first use."""
+        with self._semantic_lock:
+            if self._semantic_index is None:
+                index: Dict[str, List[Tuple[str, Counter]]] = {}
+                for meta_path in self.cache_dir.glob("vscript_*.meta.json"):
+                    try:
+                        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                        index.setdefault(meta["title_key"], []).append(
+                            (meta["key"], Counter(meta["plot_vector"]))
+                        )
+                    except (OSError, ValueError, KeyError) as e:
+                        logger.debug(f"Skipping script cache sidecar {meta_path.name}: {e}")
+                self._semantic_index = index
+            return self._semantic_index
+
+    def _find_similar_script(self, movie_title: str, plot: str) -> Optional[VideoScript]:
+        """
+        Return a cached script whose plot nearly matches this one.
+
+        Catches re-scraped plots with whitespace or minor wording edits that
+        miss the exact content-hash key. Only scripts for the same title and
+        system prompt are considered.
+        """
+        candidates = self._get_semantic_index().get(self._title_key(movie_title), [])
+        if not candidates:
+            return None
+
+        vector = _plot_vector(plot)
+        best_key, best_score = None, 0.0
+        for key, cached_vector in candidates:
+            score = _cosine_similarity(vector, cached_vector)
+            if score > best_score:
+                best_key, best_score = key, score
+
+        if best_key is None or best_score < SEMANTIC_CACHE_THRESHOLD:
+            return None
+
+        script = self._load_cached_script(best_key)
+        if script is not None:
+            logger.info(f"Reusing near-duplicate cached script ({best_key}, similarity={best_score:.3f})")
+        return script
+
+    def _load_cached_script(self, key: str) -> Optional[VideoScript]:
+        """Return the cached script for a key, or None if missing, expired or unreadable."""
+        path = self._cache_path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.SCRIPT_CACHE_TTL_SECONDS:
+                return None
+            return VideoScript.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError) as e:
+            logger.warning(f"Ignoring unreadable script cache entry {path.name}: {e}")
+            return None
+
+    def _store_cached_script(self, key: str, script: VideoScript, movie_title: str, plot: str) -> None:
+        """Write a finished script and its near-duplicate sidecar to the cache (best effort)."""
+        title_key = self._title_key(movie_title)
+        vector = _plot_vector(plot)
+        try:
+            self._cache_path(key).write_text(script.model_dump_json(), encoding="utf-8")
+            self._meta_path(key).write_text(
+                json.dumps({"key": key, "title_key": title_key, "plot_vector": vector}),
+                encoding="utf-8",
+            )
+        except OSError as e:
+            logger.warning(f"Could not write script cache entry: {e}")
+            return
+
+        index = self._get_semantic_index()
+        with self._semantic_lock:
+            entries = [entry for entry in index.get(title_key, []) if entry[0] != key]
+            entries.append((key, vector))
+            index[title_key] = entries
+
+    def invalidate(self, key: str) -> bool:
+        """
+        Drop a cached script.
+
+        Args:
+            key: Key from script_cache_key()
+
+        Returns:
+            True if an entry was removed
+        """
+        self._meta_path(key).unlink(missing_ok=True)
+        with self._semantic_lock:
+            if self._semantic_index is not None:
+                for title_key, entries in self._semantic_index.items():
+                    self._semantic_index[title_key] = [e for e in entries if e[0] != key]
+        try:
+            self._cache_path(key).unlink()
+            return True
+        except FileNotFoundError:
+            return False
 
     def _log_result(self, movie_title: str, data: dict) -> Path:
         """
@@ -185,172 +627,70 @@ class StoryGenerator:
             Path to the log file
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_title = "".join(c if c.isalnum() else "_" for c in movie_title)[:30]
+        safe_title = movie_title[:30].translate(_SAFE_TITLE_TABLE)
         filename = f"{timestamp}_{safe_title}_video_script.json"
         log_path = self.log_dir / filename
 
-        with open(log_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        log_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
         logger.info(f"Logged video script to {log_path}")
         return log_path
 
     def _build_system_prompt(self) -> str:
-        """Build the Storyteller system prompt with available genres and TTS customization."""
+        """
+        Build the Storyteller system prompt with available genres and TTS customization.
+
+        The JSON schema is not restated here: Gemini receives it structurally via
+        response_schema, and the Groq fallback appends a compact copy.
+        """
         available_genres = list(MUSIC_GENRES.keys())
         available_moods = list(SCENE_MOOD_SPEEDS.keys())
         available_voices = get_available_voices_for_groq()
 
-        schema = VideoScript.model_json_schema()
-
-        system_prompt = f"""You are a conversational storyteller who explains movie plots for social media - fast, engaging, with a killer hook.
-
-Your task is to TELL THE STORY of a movie in 45-60 seconds. This is for TikTok/Reels/Shorts - you have 3 seconds to hook them or they scroll.
-
-## SOCIAL MEDIA PACING (CRITICAL):
-- **Scene 1 MUST start with a HOOK** - the most interesting, shocking, or intriguing part of the story
-- Lead with conflict, death, betrayal, twist, or stakes - NOT "This is a story about..."
-- Keep it FAST - every sentence should move the plot forward
-- No filler, no setup that doesn't pay off, no slow burns
-- Think "wait, WHAT?" energy in the first 5 seconds
-
-## HOOK FORMULAS (Scene 1 must use one):
-- Start with the twist/conflict: "So this guy finds out his wife has been dead for 3 years - but she's standing right in front of him."
-- Start with stakes: "He's got 24 hours to find $2 million or his daughter dies."
-- Start with action: "She wakes up covered in blood with no memory of the last 6 hours."
-- Start with the weird: "This dude can see exactly how everyone around him is going to die."
-- Start mid-story: "So he's standing there with a gun to his best friend's head, and we gotta rewind to see how he got here."
-
-## ANTI-TRAILER RULES:
-- NO dramatic one-liners or taglines ("Everything changed...", "Nothing would ever be the same...")
-- NO hype language ("epic showdown", "ultimate battle", "thrilling conclusion")
-- NO vague mystery-building ("little did he know...", "what he discovered would shock him...")
-- NO trailer cadence with dramatic pauses on every sentence
-- YES: Just tell me what happened, plainly but engagingly
-- YES: Be specific about plot points, not vague and teasing
-- YES: Sound like a person recounting events, not a movie announcer
-
-## Your Responsibilities:
+        system_prompt = f"""You are a conversational storyteller who explains movie plots for TikTok/Reels/Shorts. Tell the WHOLE story of a movie in 45-60 seconds - you have 3 seconds to hook viewers before they scroll.
 
-1. **Genre Classification**: Identify the PRIMARY genre of the movie. Choose the single best match from:
-   {available_genres}
+## Pacing and Tone
+- Scene 1 MUST open with a HOOK: the most shocking or intriguing part (conflict, death, betrayal, twist, stakes) - never "This is a story about..."
+  Example hook: "He's got 24 hours to find $2 million or his daughter dies."
+- Every sentence moves the plot forward. No filler, no slow setup.
+- Be specific: "he gets shot in the leg and crawls to the car", NOT "he faced impossible odds".
+- Sound like a person recounting events to a friend, past tense, plain but engaging, specific about plot points.
+- NO trailer language: no taglines ("Everything changed...", "Nothing would ever be the same..."), no hype ("epic showdown", "ultimate battle"), no vague teasing ("little did he know..."), no rhetorical questions, no "In a world..." / "Coming soon..." / "Watch to find out...".
 
-   Be specific! A horror movie is "horror", not "thriller". A sci-fi movie is "sci-fi", not "action".
-
-2. **Voice Selection**: Choose the best voice for this movie's tone from:
+## Fields
+1. **genre**: the single best PRIMARY genre from {available_genres}. Be specific (horror is "horror", not "thriller").
+2. **selected_voice_id**: the best voice for the movie's tone from:
 {available_voices}
-
-3. **Overall Mood for TTS**: Choose ONE overall_mood that defines the consistent tone for the ENTIRE video's voice narration.
-   This ensures the TTS voice sounds consistent across all scenes rather than changing tone between scenes.
-   Choose from: {available_moods}
-   Examples:
-   - Horror movies: "horror" or "suspenseful"
-   - Action movies: "action" or "exciting"
-   - Drama movies: "dramatic" or "sad"
-   - Comedy movies: "comedic" or "happy"
-   - Romance movies: "romantic" or "calm"
-
-4. **BPM/Tempo**: Estimate an appropriate tempo (60-200 BPM) for the video pacing.
-
-5. **Scene Creation**: Create exactly 6 scenes that cover the FULL arc of the movie:
-   - **narration**: Conversational storytelling text (25-40 words).
-     * **Tone**: Like you're explaining the movie to a friend. Past tense. Factual but engaging.
-     * **Prohibited**: "In a world...", "Coming soon...", "Watch to find out...", rhetorical questions, dramatic taglines, hype words.
-     * **Style**: Natural speech patterns. How would you actually tell someone this story out loud?
-
-   ## CRITICAL - Narration Flow & Coherence:
-   The 6 scenes must read as ONE continuous story when played back-to-back, not 6 separate paragraphs.
-
-   **Character Name Rules**:
-   - Introduce the protagonist's name ONCE in Scene 1 only.
-   - After Scene 1, use PRONOUNS ("he", "she", "they") or descriptive references ("the detective", "our hero").
-   - NEVER repeat the character's name in every scene. Maximum 2 name mentions across all 6 scenes.
-
-   **Sentence Structure Variety** (MANDATORY - vary these across scenes):
-   - Start with context: "So basically..." / "The thing is..."
-   - Start with what happens: "He ends up..." / "She finds out that..."
-   - Start with transition: "Meanwhile..." / "At the same time..."
-   - Start with revelation: "Turns out..." / "Here's the twist..."
-   - Start with time: "A few days later..." / "That night..."
-   - Start with consequence: "That's when things go wrong..." / "The problem is..."
-
-   **Scene Transitions**: Each scene should feel like you're continuing the same story:
-   - Scene 2 should pick up where Scene 1 left off
-   - Use natural connectors: "So then...", "Turns out...", "The problem was...", "That's when...", "And here's where it gets crazy..."
-   - Avoid starting every scene the same way
-
-   **Bad Example** (slow start, no hook, vague):
-   - Scene 1: "So there's this cop named John Carter, and he's been working undercover for years."
-   - Scene 2: "One day he gets a letter from his dead father."
-   - Scene 3: "He travels to Mexico to find answers."
-   - Scene 4: "He meets people along the way. Some help, some don't."
-
-   **Good Example** (hook first, fast-paced, specific):
-   - Scene 1: "John Carter just got a letter from his father - who's been dead for 10 years. It says 'I'm alive. Come find me. Tell no one.'"
-   - Scene 2: "Turns out his dad faked his death because he'd been laundering money for the cartel. He's been hiding in Mexico ever since."
-   - Scene 3: "John tracks him down, but the cartel finds out. They grab both of them. Now they've got 24 hours before execution."
-   - Scene 4: "Here's the twist - the journalist helping John? She's cartel. She's been feeding them info the whole time."
-   - **visual_queries**: Generate exactly 3 distinct Pexels search queries:
-     * Option 1 (Literal/Action): Direct visual representation of the scene action.
-     * Option 2 (Metaphorical/Abstract): Symbolic or mood-based visual.
-     * Option 3 (Vibe/Texture/Atmospheric): Lighting, texture, or atmospheric shot.
-   - **visual_style_modifiers**: Production modifiers like "4k", "cinematic lighting", "slow motion", "drone shot", "handheld".
-   - **mood**: The emotional mood of this scene. Choose from: {available_moods}
-     This controls TTS pacing - dramatic/sad scenes are slower, action/tense scenes are faster.
-   - **tts_speed**: Speech speed multiplier (1.0-1.6). All speeds 25% faster for social media:
-     * 1.0-1.15: Dramatic reveals, deaths, sad moments (slightly slower for impact)
-     * 1.2-1.3: Normal narration, context, setup
-     * 1.3-1.4: Most scenes - keep energy up
-     * 1.4-1.5: Action sequences, chase scenes, tension peaks, exciting moments
-
-## Phonetic Punctuation (TTS Optimization):
-Use punctuation to make speech sound natural, not dramatic:
-   - **Commas `,`**: Natural breath pauses, like how you'd actually speak.
-   - **Periods `.`**: End thoughts cleanly. Don't run on.
-   - **Ellipses `...`**: Use SPARINGLY for genuine pauses, not for fake drama. Once or twice per script max.
-   - **Dashes `-`**: Good for asides or quick interjections - like this one - that feel natural.
-
-## Narrative Arc (Social Media Structure):
-Hook them in Scene 1, then tell the story fast. Every scene moves the plot forward.
-
-- **Scene 1 (THE HOOK)**: Start with the most interesting part - conflict, stakes, twist, or action. Name the protagonist here.
-  BAD: "So Marcus Chen is this FBI agent who's been undercover for five years."
-  GOOD: "Marcus Chen just found out his own FBI handler sold him out to the mob. He's got 48 hours before they find him."
-  mood: "tense" or "mysterious", tts_speed: 1.25-1.35
-
-- **Scene 2 (Quick Context)**: Now fill in just enough backstory - keep it brief. Use pronouns.
-  Example: "See, he'd been undercover for five years, and someone leaked his identity. The family was already hunting him."
-  mood: "mysterious" or "exciting", tts_speed: 1.25-1.35
-
-- **Scene 3 (Escalation)**: Things get worse or more complicated. Keep the momentum.
-  Example: "He tries to get his informant out, but the FBI cuts him loose. They're hanging him out to dry."
-  mood: varies by genre, tts_speed: 1.3-1.4
-
-- **Scene 4 (The Turn)**: Major twist or revelation. This should hit hard.
-  Example: "Then he finds out the handler didn't just leak him - the guy's been working with the mob for years. Marcus was set up from day one."
-  mood: "dramatic" or "tense", tts_speed: 1.2-1.25
-
-- **Scene 5 (Climax)**: Final confrontation. Fast and intense.
-  Example: "He tracks the handler to this embassy party. Corners him in the bathroom. Gun to his head."
-  mood: "action" or "tense", tts_speed: 1.4-1.5
-
-- **Scene 6 (Resolution)**: How it ends - be specific and satisfying. Can use name again.
-  Example: "Marcus lets him live but takes the evidence. Fakes his own death. Last shot - he's running a bar in Argentina, finally free."
-  mood: varies, tts_speed: 1.2-1.25
-
-6. **Visual Query Guidelines**:
-   - Include photographic terms: 'blue hour', 'golden hour', 'silhouette', 'macro', 'wide angle', 'bokeh', 'aerial'
-   - Be specific: "hacker typing green code dark room" not "cyberpunk"
-
-Output MUST be valid JSON matching this schema:
-{json.dumps(schema, indent=2)}
+3. **overall_mood**: ONE mood from {available_moods} that sets the consistent TTS tone for ALL scenes (e.g. horror -> "horror"/"suspenseful", action -> "action"/"exciting", comedy -> "comedic"/"happy").
+4. **bpm**: tempo for the video pacing (60-200).
+5. **scenes**: exactly 6, covering the full arc including the ending:
+   - **narration** (25-40 words): natural speech, reads as ONE continuous story across scenes. Name the protagonist in Scene 1, then mostly pronouns or descriptions ("the detective") - max 2 name mentions overall. Vary openings and connect scenes ("So then...", "Turns out...", "That night...", "The problem is...", "Here's the twist...").
+   - **visual_queries**: exactly 3 Pexels queries - (1) literal action, (2) metaphorical/mood, (3) atmospheric lighting/texture. Be specific and photographic ("hacker typing green code dark room", "golden hour silhouette", "aerial", "bokeh"), not "cyberpunk".
+   - **visual_style_modifiers**: e.g. "4k", "cinematic lighting", "slow motion", "drone shot", "handheld".
+   - **mood**: one of {available_moods} (pacing reference).
+   - **tts_speed** (1.0-1.6): 1.0-1.15 dramatic reveals/sad moments, 1.2-1.3 context/setup, 1.3-1.4 most scenes, 1.4-1.5 action and tension peaks.
+
+Example flow (hook first, specific, connected):
+- Scene 1: "John Carter just got a letter from his father - who's been dead for 10 years. It says 'I'm alive. Come find me. Tell no one.'"
+- Scene 2: "Turns out his dad faked his death because he'd been laundering money for the cartel. He's been hiding in Mexico ever since."
+Not: "So there's this cop named John Carter, and he's been working undercover for years."
+
+## Narrative Arc
+1. Hook - conflict/stakes/twist, name the protagonist (tense/mysterious, 1.25-1.35)
+2. Quick context - just enough backstory (mysterious/exciting, 1.25-1.35)
+3. Escalation - things get worse (genre-dependent, 1.3-1.4)
+4. The turn - major twist or revelation (dramatic/tense, 1.2-1.25)
+5. Climax - final confrontation, fast and intense (action/tense, 1.4-1.5)
+6. Resolution - specific, satisfying ending; name may return (varies, 1.2-1.25)
+
+## Punctuation for TTS
+Commas for natural breaths, periods to end thoughts, dashes for quick asides, ellipses at most twice per script.
 
 CRITICAL:
 - Output ONLY valid JSON, no markdown.
 - genre MUST be exactly one of: {available_genres}
 - overall_mood MUST be exactly one of: {available_moods} (this is the global TTS tone for consistency)
-- mood (per scene) is for pacing reference only, but overall_mood controls actual TTS voice tone
-- tts_speed MUST be between 1.0 and 1.6 (faster pacing for social media)
+- tts_speed MUST be between 1.0 and 1.6
 - selected_voice_id should match one of the available voices listed above
 - Summarize the ENTIRE plot including the ending. Do not use cliffhangers."""
 
@@ -360,111 +700,109 @@ CRITICAL:
         self,
         movie_title: str,
         plot: str,
-        callback: Callable = None
+        callback: Callable = None,
+        use_cache: bool = True,
     ) -> VideoScript:
         """
         Generate a complete video script using the Storyteller.
 
+        Identical (title, plot) requests - or the same title with a near-identical
+        plot - are served from the on-disk script cache without calling the LLM.
+
         Args:
             movie_title: The name of the movie
             plot: The Wikipedia plot text
             callback: Optional callback for progress updates
+            use_cache: If False, always call the LLM (the new script still refreshes the cache)
 
         Returns:
             VideoScript with complete production metadata (6-scene recap)
         """
-        system_prompt = self._build_system_prompt()
-
-        user_prompt = f"""Tell me this movie's story for social media - hook me in the first line, then keep it fast (60-second recap).
-
-**Movie Title**: {movie_title}
-
-**Plot Context**:
-{plot}
-
-**Instructions**:
-- Scene 1 MUST start with a HOOK - the most interesting/shocking part. Not "This is about a guy who..."
-- Tell the whole story fast - every sentence moves the plot forward.
-- Be SPECIFIC about what happens. No vague teasing.
-- Create 6 scenes with narration and 3 visual search options per scene.
+        original_plot_length = len(plot)
+        plot = _truncate_plot(plot)
+        if len(plot) < original_plot_length:
+            logger.info(f"Plot for '{movie_title}' truncated from {original_plot_length} to {len(plot)} chars")
+
+        cache_key = self.script_cache_key(movie_title, plot)
+        if use_cache:
+            cached = self._load_cached_script(cache_key) or self._find_similar_script(movie_title, plot)
+            if cached is not None:
+                logger.info(f"Using cached video script for '{movie_title}' ({cache_key})")
+                if callback:
+                    callback('log', f"Storyteller cache hit for: {movie_title}")
+                    callback('data', "Video Script Result", cached.model_dump())
+                return cached
 
-**CRITICAL - SOCIAL MEDIA FORMAT**:
-- HOOK FIRST: Start with conflict, stakes, twist, or action. Example: "This guy just found out his wife has been dead for 3 years - but she's standing right in front of him."
-- Keep it FAST: No filler, no slow setup. Get to the action.
-- NO trailer language: avoid "epic", "ultimate", "nothing would ever be the same"
-- Mention protagonist's name in Scene 1 (during the hook), then use pronouns for Scenes 2-5.
-- Be specific: "he gets shot in the leg and crawls to the car" NOT "he faced impossible odds"
+        system_prompt = self._system_prompt
 
-Output ONLY valid JSON."""
+        # Only the variable payload goes here; every instruction lives in the
+        # cached system prompt
+        user_prompt = f"Movie Title: {movie_title}\n\nPlot:\n{plot}\n\nOutput JSON only."
 
         if callback:
             callback('log', f"Storyteller generating script for: {movie_title}")
             callback('data', "System Prompt", system_prompt)
             callback('data', "User Prompt", user_prompt)
 
-        content = None
-        provider_used = "gemini"
+        content, result, provider_used = self._generate_content(system_prompt, user_prompt, callback)
 
-        # Try Gemini first (primary)
-        try:
-            if callback:
-                callback('log', f"Attempting script generation with Gemini ({self.gemini_model})...")
-            content = self._generate_with_gemini(system_prompt, user_prompt)
-            logger.info(f"Script generated successfully with Gemini")
-        except Exception as e:
-            # Gemini failed - log warning and fall back to Groq
-            logger.warning(f"[WARN] Gemini failed: {e}. Switching to Groq fallback...")
-            if callback:
-                callback('log', f"[WARN] Gemini failed: {e}. Switching to Groq fallback...")
-            provider_used = "groq"
+        # Auto-select voice and music based on genre if not properly set
+        if result.selected_voice_id not in TTS_VOICES:
+            result.selected_voice_id = get_voice_for_genre(result.genre)
+        result.selected_music_file = get_music_for_genre(result.genre)
 
-        # Fallback to Groq if Gemini failed
-        if content is None:
-            try:
-                if callback:
-                    callback('log', "Attempting script generation with Groq fallback...")
-                content = self._generate_with_groq(
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    model="llama-3.3-70b-versatile",
-                    response_format={"type": "json_object"}
-                )
-                logger.info(f"Script generated successfully with Groq fallback")
-            except Exception as e:
-                raise RuntimeError(f"Both Gemini and Groq failed. Last error: {e}")
+        # Set lang_code based on selected voice
+        result.lang_code = get_lang_code_for_voice(result.selected_voice_id)
 
-        try:
-            raw_json = json.loads(content)
-            result = VideoScript.model_validate(raw_json)
+        # Log result in the background so the caller is not blocked on disk
+        log_future = self._log_executor.submit(self._log_result, movie_title, {
+            "input": {"title": movie_title, "plot_length": original_plot_length},
+            "output": result.model_dump(mode="json"),
+            "raw_response": content,
+            "provider": provider_used
+        })
+        log_future.add_done_callback(_report_log_failure)
+        self._store_cached_script(cache_key, result, movie_title, plot)
 
-            # Auto-select voice and music based on genre if not properly set
-            if result.selected_voice_id not in TTS_VOICES:
-                result.selected_voice_id = get_voice_for_genre(result.genre)
-            result.selected_music_file = get_music_for_genre(result.genre)
+        if callback:
+            callback('data', "Video Script Result", result.model_dump())
+            callback('log', f"Script complete ({provider_used}): {len(result.scenes)} scenes, genre={result.genre}, voice={result.selected_voice_id}, lang={result.lang_code}, music={result.selected_music_file}")
 
-            # Set lang_code based on selected voice
-            result.lang_code = get_lang_code_for_voice(result.selected_voice_id)
+        return result
 
-            # Log result
-            self._log_result(movie_title, {
-                "input": {"title": movie_title, "plot_length": len(plot)},
-                "output": result.model_dump(),
-                "raw_response": content,
-                "provider": provider_used
-            })
+    def generate_scripts_batch(
+        self,
+        jobs: List[Tuple[str, str]],
+        max_concurrency: int = 4,
+        qpm: int = 60,
+    ) -> List[Optional[VideoScript]]:
+        """
+        Generate scripts for several movies concurrently.
 
-            if callback:
-                callback('data', "Video Script Result", result.model_dump())
-                callback('log', f"Script complete ({provider_used}): {len(result.scenes)} scenes, genre={result.genre}, voice={result.selected_voice_id}, lang={result.lang_code}, music={result.selected_music_file}")
+        Requests run on a bounded thread pool and are spaced by a
+        requests-per-minute limiter so the batch stays under provider quotas.
 
-            return result
+        Args:
+            jobs: List of (movie_title, plot) tuples
+            max_concurrency: Maximum number of scripts generated at once
+            qpm: Maximum script requests started per minute
 
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Failed to parse JSON response: {e}")
-        except ValidationError as e:
-            raise ValueError(f"Response doesn't match VideoScript schema: {e}")
+        Returns:
+            Scripts in the same order as jobs, with None for jobs that failed
+        """
+        limiter = _RateLimiter(qpm)
+
+        def run_job(job: Tuple[str, str]) -> Optional[VideoScript]:
+            movie_title, plot = job
+            limiter.acquire()
+            try:
+                return self.generate_script(movie_title=movie_title, plot=plot)
+            except Exception as e:
+                logger.error(f"Batch script generation failed for '{movie_title}': {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            return list(executor.map(run_job, jobs))
 
 
 def generate_character_blueprint(
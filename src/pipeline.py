@@ -9,15 +9,22 @@ This module orchestrates the complete video generation workflow:
     5. Render final video with background music and subtitles
 """
 
-import json
+import bisect
+import hashlib
 import logging
+import os
 import random
 import shutil
+import string
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import wave
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Generator, List, Optional, Tuple, Dict, Any
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
+
+import numpy as np
+import orjson
 
 from src.config import Config
 from src.moviedbapi import MovieDBClient
@@ -25,14 +32,17 @@ from src.narrative import StoryGenerator, VideoScript, Scene
 from src.gemini_tts import generate_audio
 from src.stock_media import download_video
 from src.subtitles import generate_karaoke_subtitles
-from src.renderer import VideoRenderer
+from src.renderer import VideoRenderer, link_or_copy
 
 logger = logging.getLogger(__name__)
 
 CACHE_FILENAME = "pipeline_cache.json"
 
+# Scenes whose TTS + stock download run at the same time in step 2
+SCENE_CONCURRENCY = 4
+
 
-@dataclass
+@dataclass(slots=True)
 class SceneAssets:
     """Holds all assets for a single scene."""
     index: int
@@ -42,12 +52,16 @@ class SceneAssets:
     audio_duration: float
     video_path: str
     video_metadata: dict
-    word_timestamps: Optional[List[dict]] = None
+    # Word timestamps on the final video timeline, as parallel arrays
+    words: Optional[List[str]] = None
+    word_starts: Optional[np.ndarray] = None
+    word_ends: Optional[np.ndarray] = None
     poster_path: Optional[str] = None  # If set, use this image instead of video
     is_ending_scene: bool = False  # True for the final "This was the story of..." scene
+    transcript_future: Optional[Future] = None  # Background Whisper job started once audio exists
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineStatus:
     """Represents a status update from the pipeline."""
     step: int
@@ -74,8 +88,6 @@ def _create_silent_audio(output_path: str, duration_seconds: float = 3.0,
     Returns:
         The output path where the file was saved.
     """
-    import wave
-
     num_frames = int(sample_rate * duration_seconds)
     # Create silent PCM data (all zeros)
     silent_data = bytes(num_frames * channels * sample_width)
@@ -90,6 +102,59 @@ def _create_silent_audio(output_path: str, duration_seconds: float = 3.0,
     return output_path
 
 
+def _wav_duration(path: Path) -> float:
+    """Duration in seconds of a PCM WAV file, read from its header."""
+    with wave.open(str(path), 'rb') as wf:
+        return wf.getnframes() / float(wf.getframerate())
+
+
+def generate_audio_cached(
+    text: str,
+    output_path: str,
+    voice: str,
+    speed: float,
+    mood: Optional[str] = None,
+) -> Optional[Tuple[str, float]]:
+    """
+    generate_audio with a content-addressed cache of previously synthesized WAVs.
+
+    The cache key covers everything that changes the audio (TTS model, voice,
+    speed, mood and text), so re-runs and repeated ending lines skip the API call.
+
+    Returns:
+        Tuple of (output_path, duration_seconds), or None if generation fails.
+    """
+    key = hashlib.sha256(
+        f"{Config.TTS_MODEL}|{voice}|{speed}|{mood}|{text}".encode("utf-8")
+    ).hexdigest()
+    cached_path = Config.TTS_CACHE_DIR / f"tts_{key}.wav"
+    output = Path(output_path)
+
+    if cached_path.exists():
+        try:
+            link_or_copy(cached_path, output)
+            duration = max(0.1, _wav_duration(output))
+            logger.info(f"TTS cache hit: {output} ({duration:.2f}s)")
+            return str(output), duration
+        except (OSError, wave.Error) as e:
+            logger.warning(f"Ignoring unreadable TTS cache entry {cached_path}: {e}")
+
+    result = generate_audio(
+        text=text,
+        output_path=output_path,
+        voice=voice,
+        speed=speed,
+        mood=mood,
+    )
+    if result is not None:
+        try:
+            cached_path.parent.mkdir(parents=True, exist_ok=True)
+            link_or_copy(Path(result[0]), cached_path)
+        except OSError as e:
+            logger.warning(f"Failed to store TTS cache entry: {e}")
+    return result
+
+
 # Creative ending templates for the movie reveal
 # {title} = movie title, {year} = release year
 # Templates designed to be impactful and clearly state the movie name and year
@@ -101,33 +166,75 @@ ENDING_TEMPLATES = [
     "The movie? {title}. The year? {year}.",
 ]
 
-# Lazy-loaded Whisper model
-_whisper_model = None
 
+def _compile_ending_template(template: str) -> Callable[[str, str], str]:
+    """Pre-split an ending template into literal/field pieces so rendering is a join."""
+    pieces = [
+        (literal, field_name)
+        for literal, field_name, _spec, _conversion in string.Formatter().parse(template)
+    ]
+
+    def render(title: str, year: str) -> str:
+        values = {'title': title, 'year': year}
+        return "".join(literal + (values[field_name] if field_name else "") for literal, field_name in pieces)
+
+    return render
+
+
+_ENDING_RENDERERS = [_compile_ending_template(template) for template in ENDING_TEMPLATES]
+
+
+WHISPER_SAMPLE_RATE = 16000
+# Batched transcription cuts the combined audio into windows of this many
+# seconds (Whisper's native context) and decodes this many windows at once
+WHISPER_CHUNK_SECONDS = 30
+WHISPER_BATCH_SIZE = 24
+# Silero VAD drops TTS lead-in/trailing silence before the encoder sees it;
+# faster-whisper maps timestamps back onto the untrimmed audio
+WHISPER_VAD_PARAMETERS = {"min_silence_duration_ms": 300}
 
+# Lazy-loaded Whisper model, kept resident for the life of the process so
+# later pipeline runs skip the load
+_whisper_model = None
 _whisper_load_lock = threading.Lock()
 
+# Process-wide transcription pool, so long-running servers don't leak a thread
+# per pipeline. Scene transcription runs here while later scenes are still in
+# TTS; one worker since the model instance is shared.
+_WHISPER_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper")
+
 
 def _get_whisper_model():
-    """Lazily load the Whisper model (thread-safe)."""
+    """Lazily load the faster-whisper model (thread-safe)."""
     global _whisper_model
     if _whisper_model is None:
         with _whisper_load_lock:
             if _whisper_model is None:
-                import whisper
-                logger.info("Loading Whisper model (base)...")
-                _whisper_model = whisper.load_model("base")
+                import ctranslate2
+                from faster_whisper import WhisperModel
+
+                # FP16 uses the GPU's tensor cores; int8 keeps CPU inference fast
+                use_cuda = ctranslate2.get_cuda_device_count() > 0
+                compute_type = Config.WHISPER_COMPUTE_TYPE or ("float16" if use_cuda else "int8")
+                logger.info(f"Loading Whisper model (base, {compute_type})...")
+                _whisper_model = WhisperModel(
+                    "base",
+                    device="cuda" if use_cuda else "cpu",
+                    compute_type=compute_type,
+                    cpu_threads=os.cpu_count() or 0,
+                )
     return _whisper_model
 
 
 def _preload_whisper_model():
-    """Start loading Whisper model in background thread."""
-    threading.Thread(target=_get_whisper_model, daemon=True).start()
+    """Start loading Whisper model in background thread if it is not resident yet."""
+    if _whisper_model is None:
+        threading.Thread(target=_get_whisper_model, daemon=True).start()
 
 
 def whisper_transcribe(audio_path: str) -> List[dict]:
     """
-    Transcribes audio using Whisper and returns word-level timestamps.
+    Transcribes audio using faster-whisper and returns word-level timestamps.
 
     Args:
         audio_path: Path to the audio file (WAV format).
@@ -137,8 +244,129 @@ def whisper_transcribe(audio_path: str) -> List[dict]:
         Each segment contains 'text', 'start', 'end', and 'words' list.
     """
     model = _get_whisper_model()
-    result = model.transcribe(audio_path, word_timestamps=True)
-    return result.get("segments", [])
+    segments, _info = model.transcribe(
+        audio_path,
+        word_timestamps=True,
+        vad_filter=True,
+        vad_parameters=WHISPER_VAD_PARAMETERS,
+        beam_size=1,
+    )
+    # segments is a lazy generator; materialize into the openai-whisper dict schema
+    return [
+        {
+            'text': segment.text,
+            'start': segment.start,
+            'end': segment.end,
+            'words': [
+                {'word': word.word, 'start': word.start, 'end': word.end}
+                for word in (segment.words or [])
+            ],
+        }
+        for segment in segments
+    ]
+
+
+def _split_segments_by_scene(segments, boundaries: List[float]) -> List[List[dict]]:
+    """
+    Split transcribed segments of concatenated scene audio back into scenes.
+
+    Args:
+        segments: faster-whisper segments (with word timestamps) covering the
+            concatenated audio.
+        boundaries: Start offset in seconds of each scene, ascending.
+
+    Returns:
+        One list of segment dictionaries per scene, with timestamps relative
+        to the start of that scene. A segment whose words straddle a boundary
+        is split between the scenes.
+    """
+    per_scene: List[List[dict]] = [[] for _ in boundaries]
+
+    def add_segment(scene: int, text: str, start: float, end: float, words: List[dict]) -> None:
+        base = boundaries[scene]
+        per_scene[scene].append({
+            'text': text,
+            'start': start - base,
+            'end': end - base,
+            'words': [
+                {'word': w['word'], 'start': w['start'] - base, 'end': w['end'] - base}
+                for w in words
+            ],
+        })
+
+    for segment in segments:
+        words = [
+            {'word': word.word, 'start': word.start, 'end': word.end}
+            for word in (segment.words or [])
+        ]
+        if not words:
+            scene = max(0, bisect.bisect_right(boundaries, segment.start) - 1)
+            add_segment(scene, segment.text, segment.start, segment.end, [])
+            continue
+
+        # Group consecutive words by the scene their start time falls in
+        groups: Dict[int, List[dict]] = {}
+        for word in words:
+            scene = max(0, bisect.bisect_right(boundaries, word['start']) - 1)
+            groups.setdefault(scene, []).append(word)
+        if len(groups) == 1:
+            (scene, scene_words), = groups.items()
+            add_segment(scene, segment.text, segment.start, segment.end, scene_words)
+            continue
+        for scene, scene_words in groups.items():
+            add_segment(
+                scene,
+                "".join(w['word'] for w in scene_words),
+                scene_words[0]['start'],
+                scene_words[-1]['end'],
+                scene_words,
+            )
+
+    return per_scene
+
+
+def whisper_transcribe_batch(audio_paths: List[str], durations: List[float]) -> List[List[dict]]:
+    """
+    Transcribe several scene audios in one batched faster-whisper call.
+
+    The scene audios are laid end to end (each padded or trimmed to its known
+    duration, which is what the renderer uses) and transcribed together, then
+    the result is split back at the scene boundaries.
+
+    Args:
+        audio_paths: Scene audio files in playback order.
+        durations: Duration in seconds of each scene audio.
+
+    Returns:
+        One list of segment dictionaries per scene (same schema as
+        whisper_transcribe), with timestamps relative to the start of that
+        scene. A segment spanning a scene boundary is split between the scenes.
+    """
+    from faster_whisper import BatchedInferencePipeline, decode_audio
+
+    chunks = []
+    boundaries = []
+    offset = 0.0
+    for audio_path, duration in zip(audio_paths, durations):
+        boundaries.append(offset)
+        target = int(round(duration * WHISPER_SAMPLE_RATE))
+        samples = decode_audio(audio_path, sampling_rate=WHISPER_SAMPLE_RATE)[:target]
+        if len(samples) < target:
+            samples = np.pad(samples, (0, target - len(samples)))
+        chunks.append(samples)
+        offset += duration
+
+    pipeline = BatchedInferencePipeline(model=_get_whisper_model())
+    segments, _info = pipeline.transcribe(
+        np.concatenate(chunks),
+        batch_size=WHISPER_BATCH_SIZE,
+        chunk_length=WHISPER_CHUNK_SECONDS,
+        vad_parameters=WHISPER_VAD_PARAMETERS,
+        word_timestamps=True,
+        beam_size=1,
+    )
+
+    return _split_segments_by_scene(segments, boundaries)
 
 
 def generate_ending_text(movie_title: str, release_year: str) -> str:
@@ -152,8 +380,8 @@ def generate_ending_text(movie_title: str, release_year: str) -> str:
     Returns:
         A creative ending sentence
     """
-    template = random.choice(ENDING_TEMPLATES)
-    return template.format(title=movie_title, year=release_year or "an unforgettable year")
+    render = random.choice(_ENDING_RENDERERS)
+    return render(movie_title, release_year or "an unforgettable year")
 
 
 class VideoGenerationPipeline:
@@ -168,31 +396,46 @@ class VideoGenerationPipeline:
         5. Render final video
     """
 
-    def __init__(self, offline: bool = False, clean: bool = False):
+    def __init__(self, offline: bool = False, clean: bool = False, preload_whisper: bool = True):
         """
         Initialize the pipeline.
 
         Args:
             offline: If True, use cached data instead of making API calls.
             clean: If True, delete temp files after successful render.
+            preload_whisper: If True, start loading the Whisper model in the
+                background now instead of at the start of run().
         """
         self.offline = offline
         self.clean = clean
+        if preload_whisper:
+            _preload_whisper_model()
         Config.ensure_directories()
         self.movie_client = None if offline else MovieDBClient(tmdb_api_key=Config.TMDB_API_KEY)
         self.story_gen = None if offline else StoryGenerator()
+        # Shared TTS/download pool, created per run in step 2 (transcription
+        # uses the process-wide _WHISPER_POOL)
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        # movie name -> temp output dir, so the path is built and mkdir'd once
+        self._output_dirs: Dict[str, Path] = {}
+        # Final (scene_assets, script, video_path) of the last run()
+        self.result: Tuple[List[SceneAssets], Optional[VideoScript], Optional[str]] = ([], None, None)
 
     def _cleanup_temp_dir(self, movie_name: str) -> None:
         """Remove the temp directory for a movie after successful render."""
+        self._output_dirs.pop(movie_name, None)
         temp_dir = Config.TEMP_DIR / Config.safe_title(movie_name)
         if temp_dir.exists():
             shutil.rmtree(temp_dir)
             logger.info(f"Cleaned up temp directory: {temp_dir}")
 
     def _get_output_dir(self, movie_name: str) -> Path:
-        """Get the temp output directory for a movie."""
-        output_dir = Config.TEMP_DIR / Config.safe_title(movie_name)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        """Get the temp output directory for a movie (created on first use)."""
+        output_dir = self._output_dirs.get(movie_name)
+        if output_dir is None:
+            output_dir = Config.TEMP_DIR / Config.safe_title(movie_name)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._output_dirs[movie_name] = output_dir
         return output_dir
 
     def _get_cache_path(self, movie_name: str) -> Path:
@@ -202,20 +445,21 @@ class VideoGenerationPipeline:
     def _load_cache(self, movie_name: str) -> Optional[Dict]:
         """Load cached data for a movie if it exists."""
         cache_path = self._get_cache_path(movie_name)
-        if cache_path.exists():
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to load cache: {e}")
-        return None
+        if not cache_path.exists():
+            return None
+        try:
+            return orjson.loads(cache_path.read_bytes())
+        except (orjson.JSONDecodeError, OSError) as e:
+            logger.warning(f"Failed to load cache: {e}")
+            return None
 
     def _save_cache(self, movie_name: str, cache_data: Dict) -> None:
         """Save cache data for a movie."""
         cache_path = self._get_cache_path(movie_name)
         cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, indent=2, ensure_ascii=False)
+        # Scene assets are plain dicts of paths, durations and metadata, so the
+        # whole cache stays one orjson document (no pickle to execute on load)
+        cache_path.write_bytes(orjson.dumps(cache_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         logger.info(f"Cache saved to {cache_path}")
 
     def _process_scene_parallel(
@@ -256,7 +500,7 @@ class VideoGenerationPipeline:
         def generate_tts():
             nonlocal audio_path, audio_duration
             status_messages.append(f"Generating TTS for scene {scene_num} (mood={overall_mood}, speed={tts_speed})...")
-            audio_path, audio_duration = generate_audio(
+            audio_path, audio_duration = generate_audio_cached(
                 text=scene.narration,
                 output_path=audio_output_path,
                 voice=voice_id,
@@ -280,13 +524,14 @@ class VideoGenerationPipeline:
             else:
                 status_messages.append(f"Scene {scene_num}: Downloaded video for '{video_metadata.get('query', queries[0])}'")
 
-        # Execute TTS and video download in parallel
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            futures = [
-                executor.submit(generate_tts),
-                executor.submit(download_stock_video)
-            ]
-            for future in as_completed(futures):
+        # Execute TTS and video download in parallel on the run's shared I/O pool
+        futures = [
+            self._io_pool.submit(generate_tts),
+            self._io_pool.submit(download_stock_video)
+        ]
+        done, _pending = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in futures:
+            if future in done:
                 try:
                     future.result()
                 except Exception as e:
@@ -304,12 +549,26 @@ class VideoGenerationPipeline:
         """
         Runs the video generation pipeline as a generator yielding status updates.
 
+        The final tuple is also stored on self.result, so callers can drive
+        the generator with a plain for loop instead of catching StopIteration.
+
         Yields:
             PipelineStatus objects with progress information.
 
         Returns:
             Tuple of (List[SceneAssets], VideoScript, final_video_path).
         """
+        self.result = ([], None, None)
+        self.result = (yield from self._run(movie_name, mode=mode, **kwargs)) or ([], None, None)
+        return self.result
+
+    def _run(
+        self,
+        movie_name: str,
+        mode: str = "movie",
+        **kwargs
+    ) -> Generator[PipelineStatus, None, Tuple[List[SceneAssets], Optional[VideoScript], Optional[str]]]:
+        """Pipeline body behind run()."""
         # Validate config for the requested mode (skip for offline)
         if not self.offline:
             Config.validate(mode=mode)
@@ -326,15 +585,9 @@ class VideoGenerationPipeline:
                 num_episodes=num_episodes,
             )
             
-            # Consume and re-yield the series pipeline status
-            final_path = None
-            try:
-                while True:
-                    status = next(gen)
-                    yield status
-            except StopIteration as e:
-                final_path = e.value
-            
+            # Re-yield the series pipeline status and take its return value
+            final_path = yield from gen
+
             return ([], None, final_path)
 
         scene_assets_list: List[SceneAssets] = []
@@ -342,13 +595,26 @@ class VideoGenerationPipeline:
         cache_data: Dict = {}
         output_dir = self._get_output_dir(movie_name)
 
+        # One directory read up front instead of a stat() per cached asset.
+        # Files written later in this run are added as they are created.
+        known_files = {entry.name for entry in os.scandir(output_dir) if entry.is_file()}
+
+        def file_exists(path: Optional[str]) -> bool:
+            if not path:
+                return False
+            candidate = Path(path)
+            if candidate.parent == output_dir:
+                return candidate.name in known_files
+            return candidate.exists()
+
         try:
             # =================================================================
             # Step 1: Fetch Movie Data & Generate Script
             # =================================================================
             yield PipelineStatus(step=1, message="Fetching movie data...")
 
-            # Start loading Whisper model in background (needed in Step 3)
+            # Make sure the Whisper model is loading (needed in Step 3); a no-op
+            # once it is resident
             _preload_whisper_model()
 
             if self.offline:
@@ -432,13 +698,19 @@ class VideoGenerationPipeline:
                 if poster_local_path:
                     yield PipelineStatus(step=1, message=f"Poster downloaded: {poster_local_path}")
                     cache_data['poster_path'] = poster_local_path
+                    known_files.add(Path(poster_local_path).name)
                 else:
                     yield PipelineStatus(step=1, message="Could not download poster (will skip ending poster scene)")
             elif self.offline:
                 poster_local_path = cache_data.get('poster_path')
-                if poster_local_path and Path(poster_local_path).exists():
+                if file_exists(poster_local_path):
                     yield PipelineStatus(step=1, message="Using cached poster")
 
+            # Persist progress after each major step so a later failure can
+            # still be resumed with --offline
+            if not self.offline:
+                self._save_cache(movie_name, cache_data)
+
             # Generate script
             yield PipelineStatus(step=1, message="Generating video script with AI...")
 
@@ -455,6 +727,7 @@ class VideoGenerationPipeline:
                     plot=plot
                 )
                 cache_data['video_script'] = script.model_dump()
+                self._save_cache(movie_name, cache_data)
 
             yield PipelineStatus(
                 step=1,
@@ -471,7 +744,32 @@ class VideoGenerationPipeline:
             if 'scene_assets' not in cache_data:
                 cache_data['scene_assets'] = {}
 
-            for scene in script.scenes:
+            # Script-level TTS settings shared by every scene and the ending
+            voice_id = script.selected_voice_id
+            overall_mood = script.overall_mood
+
+            # Up to SCENE_CONCURRENCY scenes are generated at once; results are
+            # still consumed (and reported) in scene order below
+            scene_futures: List[Future] = []
+            scene_pool = None
+            if not self.offline:
+                self._io_pool = ThreadPoolExecutor(
+                    max_workers=min(32, 4 * len(script.scenes)),
+                    thread_name_prefix="scene-io",
+                )
+                scene_pool = ThreadPoolExecutor(max_workers=SCENE_CONCURRENCY, thread_name_prefix="scene")
+                scene_futures = [
+                    scene_pool.submit(
+                        self._process_scene_parallel,
+                        scene=scene,
+                        output_dir=output_dir,
+                        voice_id=voice_id,
+                        overall_mood=overall_mood,
+                    )
+                    for scene in script.scenes
+                ]
+
+            for position, scene in enumerate(script.scenes):
                 scene_num = scene.scene_index
                 scene_cache_key = f"scene_{scene_num}"
 
@@ -495,7 +793,7 @@ class VideoGenerationPipeline:
                     audio_duration = cached_scene['audio_duration']
                     video_metadata = cached_scene['video_metadata']
 
-                    if not Path(audio_path).exists() or not Path(video_path).exists():
+                    if not file_exists(audio_path) or not file_exists(video_path):
                         yield PipelineStatus(
                             step=2,
                             message=f"Cached files not found for scene {scene_num}",
@@ -507,12 +805,7 @@ class VideoGenerationPipeline:
                 else:
                     try:
                         audio_path, video_path, audio_duration, video_metadata, status_msgs = \
-                            self._process_scene_parallel(
-                                scene=scene,
-                                output_dir=output_dir,
-                                voice_id=script.selected_voice_id,
-                                overall_mood=script.overall_mood,
-                            )
+                            scene_futures[position].result()
 
                         for msg in status_msgs:
                             yield PipelineStatus(step=2, message=msg)
@@ -523,6 +816,7 @@ class VideoGenerationPipeline:
                             'video_path': video_path,
                             'video_metadata': video_metadata
                         }
+                        self._save_cache(movie_name, cache_data)
                     except Exception as e:
                         yield PipelineStatus(
                             step=2,
@@ -540,8 +834,16 @@ class VideoGenerationPipeline:
                     video_path=video_path,
                     video_metadata=video_metadata
                 )
+                if not self.offline:
+                    scene_asset.transcript_future = _WHISPER_POOL.submit(whisper_transcribe, audio_path)
                 scene_assets_list.append(scene_asset)
 
+            if scene_pool is not None:
+                scene_pool.shutdown(wait=False)
+            if self._io_pool is not None:
+                self._io_pool.shutdown(wait=False)
+                self._io_pool = None
+
             if not scene_assets_list:
                 yield PipelineStatus(step=2, message="No scenes were processed successfully.", is_error=True)
                 return scene_assets_list, script, None
@@ -560,8 +862,7 @@ class VideoGenerationPipeline:
                 if cached_ending:
                     ending_audio_path = cached_ending.get('audio_path')
                     ending_poster_path = cached_ending.get('poster_path')
-                    if (ending_audio_path and Path(ending_audio_path).exists() and
-                        ending_poster_path and Path(ending_poster_path).exists()):
+                    if file_exists(ending_audio_path) and file_exists(ending_poster_path):
                         yield PipelineStatus(step=2, message="Loading cached ending scene...")
                         ending_scene_asset = SceneAssets(
                             index=len(scene_assets_list),
@@ -580,7 +881,7 @@ class VideoGenerationPipeline:
                         yield PipelineStatus(step=2, message="Cached ending scene files not found")
                 else:
                     yield PipelineStatus(step=2, message="No ending scene in cache")
-            elif poster_local_path and Path(poster_local_path).exists():
+            elif file_exists(poster_local_path):
                 yield PipelineStatus(step=2, message="Creating ending scene with movie poster...")
 
                 # Generate the creative ending text
@@ -593,12 +894,12 @@ class VideoGenerationPipeline:
                 tts_failed = False
 
                 try:
-                    tts_result = generate_audio(
+                    tts_result = generate_audio_cached(
                         text=ending_text,
                         output_path=ending_audio_path,
-                        voice=script.selected_voice_id,
+                        voice=voice_id,
                         speed=1.2,  # Slightly slower for the reveal (but still 25% faster overall)
-                        mood=script.overall_mood,
+                        mood=overall_mood,
                     )
 
                     if tts_result is not None:
@@ -634,6 +935,9 @@ class VideoGenerationPipeline:
                     poster_path=poster_local_path,
                     is_ending_scene=True,
                 )
+                ending_scene_asset.transcript_future = _WHISPER_POOL.submit(
+                    whisper_transcribe, ending_audio_path
+                )
                 scene_assets_list.append(ending_scene_asset)
 
                 # Cache the ending scene
@@ -644,6 +948,7 @@ class VideoGenerationPipeline:
                     'narration': ending_text if not tts_failed else "",
                     'silent_fallback': tts_failed,
                 }
+                self._save_cache(movie_name, cache_data)
 
                 yield PipelineStatus(step=2, message="Ending scene created with movie poster")
             else:
@@ -657,39 +962,62 @@ class VideoGenerationPipeline:
             all_whisper_segments = []
             cumulative_offset = 0.0
 
-            for asset in scene_assets_list:
+            # Scenes processed in this run were submitted for transcription as
+            # soon as their audio existed; the rest (cached scenes) are batched here
+            batched_segments: Dict[int, List[dict]] = {}
+            pending = [
+                position for position, asset in enumerate(scene_assets_list)
+                if asset.transcript_future is None
+            ]
+            if pending:
+                try:
+                    batched_segments = dict(zip(pending, whisper_transcribe_batch(
+                        [scene_assets_list[position].audio_path for position in pending],
+                        [scene_assets_list[position].audio_duration for position in pending],
+                    )))
+                except Exception as e:
+                    yield PipelineStatus(
+                        step=3,
+                        message=f"Whisper batch transcription failed: {e}",
+                        is_error=True
+                    )
+
+            for position, asset in enumerate(scene_assets_list):
                 yield PipelineStatus(step=3, message=f"Transcribing scene {asset.index}...")
 
                 try:
-                    segments = whisper_transcribe(asset.audio_path)
-
-                    # Adjust timestamps with cumulative offset and store on asset
-                    adjusted_words = []
+                    if asset.transcript_future is not None:
+                        segments = asset.transcript_future.result()
+                    elif position in batched_segments:
+                        segments = batched_segments[position]
+                    else:
+                        continue  # Batch failure already reported
+
+                    # Offset every word of the scene in one vectorized add
+                    scene_words = [w for segment in segments for w in segment.get('words', [])]
+                    starts = np.fromiter((w.get('start', 0) for w in scene_words), dtype=np.float64, count=len(scene_words))
+                    ends = np.fromiter((w.get('end', 0) for w in scene_words), dtype=np.float64, count=len(scene_words))
+                    starts += cumulative_offset
+                    ends += cumulative_offset
+                    adjusted_words = [
+                        {'word': w.get('word', ''), 'start': start, 'end': end}
+                        for w, start, end in zip(scene_words, starts.tolist(), ends.tolist())
+                    ]
+
+                    word_pos = 0
                     for segment in segments:
-                        for word in segment.get('words', []):
-                            adjusted_words.append({
-                                'word': word.get('word', ''),
-                                'start': word.get('start', 0) + cumulative_offset,
-                                'end': word.get('end', 0) + cumulative_offset
-                            })
-
-                        # Also add to global segments with offset
-                        adjusted_segment = segment.copy()
-                        adjusted_segment['start'] = segment.get('start', 0) + cumulative_offset
-                        adjusted_segment['end'] = segment.get('end', 0) + cumulative_offset
-                        if 'words' in adjusted_segment:
-                            adjusted_segment['words'] = [
-                                {
-                                    'word': w.get('word', ''),
-                                    'start': w.get('start', 0) + cumulative_offset,
-                                    'end': w.get('end', 0) + cumulative_offset
-                                }
-                                for w in segment.get('words', [])
-                            ]
-                        all_whisper_segments.append(adjusted_segment)
-
-                    asset.word_timestamps = adjusted_words
-                    cumulative_offset += asset.audio_duration
+                        word_count = len(segment.get('words', []))
+                        all_whisper_segments.append({
+                            'text': segment.get('text', ''),
+                            'start': segment.get('start', 0) + cumulative_offset,
+                            'end': segment.get('end', 0) + cumulative_offset,
+                            'words': adjusted_words[word_pos:word_pos + word_count],
+                        })
+                        word_pos += word_count
+
+                    asset.words = [w['word'] for w in adjusted_words]
+                    asset.word_starts = starts
+                    asset.word_ends = ends
 
                 except Exception as e:
                     yield PipelineStatus(
@@ -697,6 +1025,9 @@ class VideoGenerationPipeline:
                         message=f"Whisper transcription failed for scene {asset.index}: {e}",
                         is_error=True
                     )
+                finally:
+                    # The renderer lays scenes end to end regardless of transcription
+                    cumulative_offset += asset.audio_duration
 
             yield PipelineStatus(
                 step=3,
@@ -774,7 +1105,7 @@ class VideoGenerationPipeline:
                 )
                 return scene_assets_list, script, None
 
-            # Save cache
+            # Save final cache state
             if not self.offline:
                 self._save_cache(movie_name, cache_data)
 
@@ -814,13 +1145,9 @@ def run_pipeline(
         Tuple of (scene_assets_list, script, final_video_path).
     """
     pipeline = VideoGenerationPipeline(offline=offline, clean=clean)
-    gen = pipeline.run(movie_name, mode=mode, **kwargs)
-
-    try:
-        while True:
-            status = next(gen)
-            if progress_callback:
-                progress_callback(status.step, status.message, status.data, status.is_error)
-    except StopIteration as e:
-        # Generator return value is in e.value
-        return e.value if e.value else ([], None, None)
+
+    for status in pipeline.run(movie_name, mode=mode, **kwargs):
+        if progress_callback:
+            progress_callback(status.step, status.message, status.data, status.is_error)
+
+    return pipeline.result
@@ -1,11 +1,21 @@
+import hashlib
 import logging
+import math
+import shutil
 import subprocess
 import os
 import tempfile
+import threading
+import time
+import wave
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
 
 import ffmpeg
+import orjson
 
 from src.config import Config
 
@@ -22,6 +32,417 @@ FPS = 30
 # Duration of silent poster at the end (seconds)
 SILENT_POSTER_DURATION = 1.0
 
+# Ken Burns: pre-zoom headroom and a slow linear zoom from 100% to 105%
+KEN_BURNS_OVERSCAN = 1.1
+KEN_BURNS_ZOOM = 0.05
+
+# Hardware H.264 encoders in order of preference, with libx264 as software fallback
+HW_VIDEO_ENCODERS = ["h264_videotoolbox", "h264_nvenc", "h264_qsv"]
+SOFTWARE_VIDEO_ENCODER = "libx264"
+HW_VIDEO_BITRATE = "4M"
+HW_MAX_CONCURRENT_ENCODES = 2
+
+# Bounds for Config.IMAGE_CLIP_CACHE_DIR, enforced after each new entry
+IMAGE_CLIP_CACHE_MAX_BYTES = 2 << 30
+IMAGE_CLIP_CACHE_MAX_AGE = 30 * 24 * 3600  # seconds
+
+# A snapped Veo inpoint further than this past the requested one is logged
+VEO_MAX_KEYFRAME_SNAP = 1.0  # seconds
+
+# Lines of FFmpeg stderr kept for error messages
+FFMPEG_STDERR_TAIL_LINES = 200
+# Bytes of ffprobe stderr decoded when a probe fails
+FFPROBE_STDERR_TAIL_BYTES = 4096
+
+# One-pass escaping of a file path for use inside a filter_complex option:
+# backslash needs 4 backslashes, filter separators get a single escape
+_FILTER_PATH_ESCAPES = str.maketrans({
+    "\\": "\\\\\\\\",
+    ":": "\\:",
+    "[": "\\[",
+    "]": "\\]",
+    ",": "\\,",
+    ";": "\\;",
+})
+
+# Per-input normalize chain for the fused final render (input label and
+# output label are added around it)
+_SEGMENT_NORMALIZE_CHAIN = (
+    f"scale={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:force_original_aspect_ratio=increase,"
+    f"crop={OUTPUT_WIDTH}:{OUTPUT_HEIGHT},setsar=1,fps={FPS},format=yuv420p,"
+    f"setpts=PTS-STARTPTS"
+)
+
+# Filter graphs longer than this are passed via -filter_complex_script so a
+# long scene list can never hit the argv limit (ARG_MAX / E2BIG)
+FILTER_SCRIPT_THRESHOLD = 100_000
+
+# Intermediate clips go to a RAM-backed tmpfs when one with enough headroom
+# exists (Docker's default 64 MiB /dev/shm does not qualify)
+MEMORY_TEMP_DIR = "/dev/shm"
+MEMORY_TEMP_MIN_FREE = 1 << 30
+
+# ffprobe results keyed by (path, mtime_ns, size); persisted across runs so
+# unchanged scene audio is never probed twice. Loaded lazily.
+_probe_cache: Optional[Dict[Tuple[str, int, int], dict]] = None
+_probe_cache_dirty = False
+_probe_cache_lock = threading.Lock()
+# Most recently added probe entries kept when the cache is saved
+PROBE_CACHE_MAX_ENTRIES = 5000
+
+
+def _load_probe_cache() -> Dict[Tuple[str, int, int], dict]:
+    """Read the persisted probe cache (caller holds _probe_cache_lock)."""
+    global _probe_cache
+    if _probe_cache is None:
+        _probe_cache = {}
+        try:
+            entries = orjson.loads(Config.PROBE_CACHE_FILE.read_bytes())
+            for entry in entries:
+                _probe_cache[(entry["path"], entry["mtime_ns"], entry["size"])] = entry["probe"]
+        except FileNotFoundError:
+            pass
+        except (orjson.JSONDecodeError, KeyError, TypeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable probe cache: {e}")
+    return _probe_cache
+
+
+def save_probe_cache() -> None:
+    """
+    Persist new cached_probe results, if there are any.
+
+    Called once per render (and after indexing fallback media) rather than
+    per probe. Entries for files that no longer exist are dropped, the
+    newest PROBE_CACHE_MAX_ENTRIES are kept, and the file is replaced
+    atomically so an interrupted write never corrupts it.
+    """
+    global _probe_cache_dirty
+    with _probe_cache_lock:
+        if not _probe_cache_dirty or _probe_cache is None:
+            return
+        for key in [key for key in _probe_cache if not os.path.exists(key[0])]:
+            del _probe_cache[key]
+        for key in list(_probe_cache)[:-PROBE_CACHE_MAX_ENTRIES]:
+            del _probe_cache[key]
+        entries = [
+            {"path": path, "mtime_ns": mtime_ns, "size": size, "probe": probe}
+            for (path, mtime_ns, size), probe in _probe_cache.items()
+        ]
+        _probe_cache_dirty = False
+
+    cache_file = Config.PROBE_CACHE_FILE
+    tmp_path = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            'wb', dir=cache_file.parent, prefix=f".{cache_file.name}.", delete=False
+        ) as tmp:
+            tmp_path = tmp.name
+            tmp.write(orjson.dumps(entries))
+        os.replace(tmp_path, cache_file)
+    except OSError as e:
+        logger.warning(f"Failed to save probe cache: {e}")
+        if tmp_path:
+            Path(tmp_path).unlink(missing_ok=True)
+
+
+@lru_cache(maxsize=None)
+def _find_binary(name: str) -> Optional[str]:
+    """Absolute path of an executable on PATH, or None (looked up once)."""
+    return shutil.which(name)
+
+
+def _resolve_binary(name: str) -> str:
+    """Absolute path of an executable on PATH (name itself if not found)."""
+    return _find_binary(name) or name
+
+
+def _spawn_kwargs() -> dict:
+    """
+    Popen arguments that let CPython start the child with posix_spawn.
+
+    subprocess only takes the posix_spawn path (no fork of the parent's page
+    tables, which matters once the Whisper model is resident) for an
+    absolute executable path with close_fds=False. Descriptors are
+    non-inheritable by default (PEP 446), so nothing extra leaks.
+    """
+    return {'close_fds': False}
+
+
+def run_ffmpeg(cmd: List[str]) -> subprocess.CompletedProcess:
+    """
+    Run an FFmpeg command, keeping only the tail of its stderr.
+
+    Progress and banner output are switched off, and stderr is drained line
+    by line into a bounded buffer instead of being captured whole, so a long
+    encode cannot grow memory with log output.
+
+    Args:
+        cmd: Full command starting with 'ffmpeg'.
+
+    Returns:
+        CompletedProcess with stdout=None and stderr holding the last
+        FFMPEG_STDERR_TAIL_LINES lines.
+    """
+    cmd = [_resolve_binary(cmd[0]), '-hide_banner', '-loglevel', 'error', '-nostats', *cmd[1:]]
+    tail = deque(maxlen=FFMPEG_STDERR_TAIL_LINES)
+    with subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors='replace',
+        **_spawn_kwargs(),
+    ) as process:
+        # stderr is the only pipe, so reading it here cannot deadlock
+        for line in process.stderr:
+            tail.append(line)
+        returncode = process.wait()
+    return subprocess.CompletedProcess(cmd, returncode, None, ''.join(tail))
+
+
+@lru_cache(maxsize=64)
+def _image_video_filter(total_frames: Optional[int]) -> str:
+    """
+    Filter graph turning a single decoded still into output-sized frames.
+
+    The still is scaled (Lanczos, since it runs once) to fill 9:16 and
+    cropped to the exact output size before any frames are generated, so
+    the scaler never runs per frame. Scenes of the same length share one
+    string.
+
+    Args:
+        total_frames: Frame count for a Ken Burns zoom, or None for a
+                      static image.
+
+    Returns:
+        The -vf filter string.
+    """
+    if total_frames is not None:
+        # Linear zoom by output frame number; zoompan emits all
+        # total_frames frames from the one pre-scaled input frame. The
+        # per-frame step is folded into one constant so the zoom expression
+        # is a single multiply-add.
+        zoom_step = KEN_BURNS_ZOOM / total_frames
+        return (
+            f"scale={int(OUTPUT_WIDTH * KEN_BURNS_OVERSCAN)}:{int(OUTPUT_HEIGHT * KEN_BURNS_OVERSCAN)}"
+            f":force_original_aspect_ratio=increase:flags=lanczos,"
+            f"crop={OUTPUT_WIDTH}:{OUTPUT_HEIGHT},"
+            f"zoompan=z='1+{zoom_step:.9g}*on':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)'"
+            f":d={total_frames}:s={OUTPUT_WIDTH}x{OUTPUT_HEIGHT}:fps={FPS},"
+            f"setsar=1"
+        )
+    # Repeat the already-scaled frame instead of re-scaling every frame.
+    # The input is read at the output frame rate, so the repeated frames
+    # are already correctly timed and no fps conversion is needed.
+    return (
+        f"scale={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:force_original_aspect_ratio=increase:flags=lanczos,"
+        f"crop={OUTPUT_WIDTH}:{OUTPUT_HEIGHT},"
+        f"setsar=1,"
+        f"loop=loop=-1:size=1:start=0"
+    )
+
+
+def _filter_threads_args(threads: Optional[int]) -> List[str]:
+    """
+    Global -filter_threads option for a simple -vf encode.
+
+    Args:
+        threads: Per-worker thread share when several encodes run at once,
+            or None when this encode has the machine to itself.
+
+    Returns:
+        ffmpeg arguments to place before the inputs.
+    """
+    return ['-filter_threads', str(threads or max(2, (os.cpu_count() or 2) // 2))]
+
+
+@lru_cache(maxsize=64)
+def _still_segment_filter(total_frames: int) -> str:
+    """
+    Per-input chain for a poster image in the fused final render.
+
+    Like the static _image_video_filter, the single decoded frame is scaled
+    and cropped once and then repeated, here for exactly total_frames frames
+    with timestamps rebuilt at the output rate so it concatenates with the
+    clip segments.
+    """
+    return (
+        f"scale={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:force_original_aspect_ratio=increase:flags=lanczos,"
+        f"crop={OUTPUT_WIDTH}:{OUTPUT_HEIGHT},setsar=1,format=yuv420p,"
+        f"loop=loop={total_frames - 1}:size=1:start=0,"
+        f"setpts=N/({FPS}*TB)"
+    )
+
+
+def _scale_bitrate(bitrate: str, factor: float) -> str:
+    """Multiply an FFmpeg bitrate string such as '6M' or '2500k'."""
+    number = bitrate.rstrip('kKmMgG')
+    suffix = bitrate[len(number):]
+    value = float(number) * factor
+    return f"{int(value) if value.is_integer() else value}{suffix}"
+
+
+@lru_cache(maxsize=256)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    """
+    SHA-256 of a file's bytes, memoized per file identity.
+
+    mtime_ns and size are only part of the key, so a rewritten file is
+    hashed again while repeat lookups of an unchanged file read nothing.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _prune_image_clip_cache() -> None:
+    """
+    Evict image clip cache entries older than IMAGE_CLIP_CACHE_MAX_AGE, then
+    the least recently used ones until the cache fits IMAGE_CLIP_CACHE_MAX_BYTES.
+    """
+    cache_dir = Config.IMAGE_CLIP_CACHE_DIR
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [(entry.path, entry.stat()) for entry in it if entry.is_file()]
+    except FileNotFoundError:
+        return
+
+    cutoff = time.time() - IMAGE_CLIP_CACHE_MAX_AGE
+    # Oldest first, so the size pass evicts the least recently used entries
+    entries.sort(key=lambda item: item[1].st_mtime)
+    total = sum(st.st_size for _, st in entries)
+    for path, st in entries:
+        if st.st_mtime >= cutoff and total <= IMAGE_CLIP_CACHE_MAX_BYTES:
+            break
+        try:
+            os.unlink(path)
+            total -= st.st_size
+        except OSError as e:
+            logger.debug(f"Could not evict image clip cache entry {path}: {e}")
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """Hard-link src to dst (replacing dst), copying when a link is not possible."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _intermediate_temp_dir() -> Optional[str]:
+    """
+    Parent directory for render intermediates.
+
+    Returns:
+        MEMORY_TEMP_DIR if it is a writable tmpfs with MEMORY_TEMP_MIN_FREE
+        bytes free, else None (the system temp directory).
+    """
+    try:
+        if os.access(MEMORY_TEMP_DIR, os.W_OK) and shutil.disk_usage(MEMORY_TEMP_DIR).free >= MEMORY_TEMP_MIN_FREE:
+            return MEMORY_TEMP_DIR
+    except OSError:
+        pass
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _file_duration(path: str, mtime_ns: int, size: int) -> float:
+    """
+    Duration of a media file in seconds, memoized per file identity.
+
+    WAV files (what our TTS writes) are read from their header without
+    spawning ffprobe; everything else goes through cached_probe. mtime_ns
+    and size are only part of the key, so a rewritten file is re-read.
+    Failures raise and are therefore never cached.
+    """
+    if path.lower().endswith('.wav'):
+        try:
+            with wave.open(path, 'rb') as wf:
+                return wf.getnframes() / float(wf.getframerate())
+        except (OSError, wave.Error, ZeroDivisionError) as e:
+            logger.debug(f"WAV header read failed for {path}, falling back to ffprobe: {e}")
+    return probe_info(path).duration
+
+
+def cached_probe(path: str) -> dict:
+    """
+    ffmpeg.probe with a cache keyed by file identity (path, mtime, size).
+
+    New results are kept in memory until save_probe_cache writes them out.
+
+    Raises:
+        ffmpeg.Error: If ffprobe fails on an uncached file.
+        OSError: If the file cannot be stat'ed.
+    """
+    global _probe_cache_dirty
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    with _probe_cache_lock:
+        cache = _load_probe_cache()
+        if key in cache:
+            return cache[key]
+
+    probe = ffmpeg.probe(path)
+    with _probe_cache_lock:
+        cache[key] = probe
+        _probe_cache_dirty = True
+    return probe
+
+
+class ProbeInfo(NamedTuple):
+    """Container and first-video-stream facts from a single ffprobe run."""
+    duration: float
+    width: Optional[int]
+    height: Optional[int]
+    fps: Optional[float]
+    codec: Optional[str]
+
+
+def _parse_frame_rate(rate: Optional[str]) -> Optional[float]:
+    """Convert an ffprobe rational such as '30000/1001' to a float."""
+    if not rate:
+        return None
+    num, _, den = rate.partition('/')
+    try:
+        value = float(num) / float(den or 1)
+    except (ValueError, ZeroDivisionError):
+        return None
+    return value or None
+
+
+def probe_info(path: str) -> ProbeInfo:
+    """
+    Duration, resolution, frame rate and codec of a media file from one cached probe.
+
+    Audio-only files report None for the video fields; width and height are
+    the displayed size, after any rotation metadata is applied.
+
+    Raises:
+        ffmpeg.Error: If ffprobe fails on an uncached file.
+        OSError: If the file cannot be stat'ed.
+    """
+    probe = cached_probe(path)
+    video = next((s for s in probe.get('streams', []) if s.get('codec_type') == 'video'), {})
+    width, height = video.get('width'), video.get('height')
+    # Report display dimensions: FFmpeg autorotates before any filter runs
+    rotation = video.get('tags', {}).get('rotate') or next(
+        (side.get('rotation') for side in video.get('side_data_list', []) if 'rotation' in side), 0
+    )
+    if int(float(rotation)) % 180:
+        width, height = height, width
+    return ProbeInfo(
+        duration=float(probe['format']['duration']),
+        width=width,
+        height=height,
+        fps=_parse_frame_rate(video.get('avg_frame_rate') or video.get('r_frame_rate')),
+        codec=video.get('codec_name'),
+    )
+
 
 class VideoRenderer:
     """
@@ -30,51 +451,82 @@ class VideoRenderer:
 
     # Class-level caches for expensive checks
     _ffmpeg_available: Optional[bool] = None
+    _ffmpeg_verified: Optional[bool] = None
     _ass_filter_available: Optional[bool] = None
+    _video_encoder: Optional[str] = None
+    _cuda_available: Optional[bool] = None
 
-    def __init__(self):
-        """Initialize the VideoRenderer."""
-        pass
+    def __init__(self, preset: str = "veryfast", crf: int = 23, final_preset: Optional[str] = None):
+        """
+        Initialize the VideoRenderer.
 
-    def check_ffmpeg(self) -> bool:
+        Args:
+            preset: libx264 preset for per-scene intermediate encodes.
+            crf: libx264 constant rate factor for all encodes.
+            final_preset: libx264 preset for the final render when subtitles
+                          force a re-encode. Defaults to Config.X264_PRESET.
+        """
+        self.preset = preset
+        self.crf = crf
+        self.final_preset = final_preset or Config.X264_PRESET
+
+    def check_ffmpeg(self, strict: bool = False) -> bool:
         """
         Checks if both FFmpeg and FFprobe are installed and accessible.
-        Result is cached after first check.
-        Returns True if both are found, False otherwise.
+
+        By default this only looks the binaries up on PATH. With strict=True
+        each binary is also executed with `-version` to confirm it runs.
+        Both results are cached for the life of the process.
+
+        Args:
+            strict: If True, also run both binaries after the PATH lookup.
+
+        Returns:
+            True if both are found, False otherwise.
         """
-        if VideoRenderer._ffmpeg_available is not None:
+        if strict and VideoRenderer._ffmpeg_verified is not None:
+            return VideoRenderer._ffmpeg_verified
+        if not strict and VideoRenderer._ffmpeg_available is not None:
             return VideoRenderer._ffmpeg_available
 
-        ffmpeg_ok = False
-        ffprobe_ok = False
+        # Shares the PATH lookup that every later FFmpeg spawn resolves through
+        ffmpeg_ok = _find_binary("ffmpeg") is not None
+        ffprobe_ok = _find_binary("ffprobe") is not None
 
-        try:
-            subprocess.run(
-                ["ffmpeg", "-version"],
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            ffmpeg_ok = True
-        except (FileNotFoundError, subprocess.CalledProcessError):
+        if not ffmpeg_ok:
             logger.error("FFmpeg binary not found.")
-        except Exception as e:
-            logger.error(f"Error checking FFmpeg: {e}")
-
-        try:
-            subprocess.run(
-                ["ffprobe", "-version"],
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            ffprobe_ok = True
-        except (FileNotFoundError, subprocess.CalledProcessError):
+        if not ffprobe_ok:
             logger.error("FFprobe binary not found.")
-        except Exception as e:
-            logger.error(f"Error checking FFprobe: {e}")
 
-        if ffmpeg_ok and ffprobe_ok:
+        available = ffmpeg_ok and ffprobe_ok
+
+        if strict and available:
+            # Output is discarded, so skip the pipes; start both binaries
+            # before waiting so their startup overlaps.
+            processes = {}
+            for binary in ("ffmpeg", "ffprobe"):
+                try:
+                    processes[binary] = subprocess.Popen(
+                        [_resolve_binary(binary), "-version"],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        **_spawn_kwargs()
+                    )
+                except FileNotFoundError:
+                    logger.error(f"{binary} could not be executed.")
+                    available = False
+                except Exception as e:
+                    logger.error(f"Error checking {binary}: {e}")
+                    available = False
+            for binary, process in processes.items():
+                if process.wait() != 0:
+                    logger.error(f"{binary} could not be executed.")
+                    available = False
+
+        if strict:
+            VideoRenderer._ffmpeg_verified = available
+
+        if available:
             logger.info("FFmpeg and FFprobe are installed and accessible.")
             VideoRenderer._ffmpeg_available = True
             return True
@@ -89,9 +541,11 @@ class VideoRenderer:
 
         try:
             check_result = subprocess.run(
-                ['ffmpeg', '-filters'],
-                capture_output=True,
-                text=True
+                [_resolve_binary('ffmpeg'), '-hide_banner', '-filters'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                **_spawn_kwargs()
             )
             available = ' ass ' in check_result.stdout or 'ass\n' in check_result.stdout
             if not available:
@@ -105,11 +559,145 @@ class VideoRenderer:
             VideoRenderer._ass_filter_available = False
             return False
 
-    def _get_media_duration(self, path: str) -> float:
-        """Get duration of a media file in seconds."""
+    def _get_video_encoder(self) -> str:
+        """
+        Pick the H.264 encoder for scene encodes (cached).
+
+        Prefers a hardware encoder listed by `ffmpeg -encoders` (NVENC only when a
+        CUDA device opens), otherwise libx264.
+        """
+        if VideoRenderer._video_encoder is not None:
+            return VideoRenderer._video_encoder
+
+        encoder = SOFTWARE_VIDEO_ENCODER
+        try:
+            result = subprocess.run(
+                [_resolve_binary('ffmpeg'), '-hide_banner', '-encoders'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                **_spawn_kwargs()
+            )
+            listed = {
+                line.split()[1] for line in result.stdout.splitlines()
+                if len(line.split()) > 1
+            }
+            for candidate in HW_VIDEO_ENCODERS:
+                if candidate not in listed:
+                    continue
+                if candidate == 'h264_nvenc' and not self._check_cuda():
+                    # Many static builds ship NVENC without a GPU to run it on
+                    continue
+                encoder = candidate
+                break
+        except Exception as e:
+            logger.warning(f"Could not query FFmpeg encoders, using {SOFTWARE_VIDEO_ENCODER}: {e}")
+
+        logger.info(f"Video encoder selected: {encoder}")
+        VideoRenderer._video_encoder = encoder
+        return encoder
+
+    def _check_cuda(self) -> bool:
+        """Check if FFmpeg can open a CUDA device for NVDEC decoding (cached)."""
+        if VideoRenderer._cuda_available is not None:
+            return VideoRenderer._cuda_available
+
+        try:
+            result = subprocess.run(
+                [_resolve_binary('ffmpeg'), '-hide_banner', '-init_hw_device', 'cuda=gpu',
+                 '-f', 'lavfi', '-i', 'nullsrc=s=16x16', '-frames:v', '1', '-f', 'null', '-'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **_spawn_kwargs()
+            )
+            available = result.returncode == 0
+        except Exception:
+            available = False
+
+        if available:
+            logger.info("CUDA device available - decoding scene videos with NVDEC")
+        VideoRenderer._cuda_available = available
+        return available
+
+    def _video_encoder_args(self, encoder: str, tune: Optional[str] = None) -> List[str]:
+        """
+        FFmpeg video codec arguments for the given encoder.
+
+        Args:
+            encoder: Encoder name from _get_video_encoder.
+            tune: Optional libx264 tune (e.g. 'stillimage'); ignored by hardware encoders.
+        """
+        if encoder == SOFTWARE_VIDEO_ENCODER:
+            args = ['-c:v', SOFTWARE_VIDEO_ENCODER, '-preset', self.preset, '-crf', str(self.crf)]
+            if tune:
+                args.extend(['-tune', tune])
+            return args
+        # Hardware encoders use their native constant-quality modes at the same
+        # quality target; VideoToolbox has no portable CQ mode, so it gets a bitrate
+        # with a peak cap so busy scenes cannot spike far past it
+        if encoder == 'h264_nvenc':
+            return ['-c:v', encoder, '-preset', 'p4', '-rc', 'vbr', '-cq', str(self.crf), '-b:v', '0']
+        if encoder == 'h264_qsv':
+            return ['-c:v', encoder, '-global_quality', str(self.crf)]
+        return ['-c:v', encoder, '-b:v', HW_VIDEO_BITRATE, '-maxrate', _scale_bitrate(HW_VIDEO_BITRATE, 2)]
+
+    def _hwaccel_input_args(self, encoder: str) -> List[str]:
+        """
+        Input-side hardware decode arguments to pair with the given encoder.
+
+        Frames are downloaded to system memory after decoding, so the existing
+        scale/crop/fps filters keep working unchanged before NVENC encodes them.
+        """
+        if encoder == 'h264_nvenc' and self._check_cuda():
+            return ['-hwaccel', 'cuda']
+        return []
+
+    def _run_scene_encode(self, build_cmd, description: str) -> subprocess.CompletedProcess:
+        """
+        Run a scene encode, falling back to libx264 if the hardware encoder fails.
+
+        Args:
+            build_cmd: Callable taking the encoder name and returning the full command.
+            description: Short label used in log messages.
+
+        Returns:
+            The CompletedProcess of the last attempt.
+        """
+        encoder = self._get_video_encoder()
+        result = run_ffmpeg(build_cmd(encoder))
+
+        if result.returncode != 0 and encoder != SOFTWARE_VIDEO_ENCODER:
+            # Encoder is compiled in but the device is unusable - stick to software from now on
+            logger.warning(
+                f"{encoder} failed for {description}, falling back to {SOFTWARE_VIDEO_ENCODER}: "
+                f"{result.stderr[-200:]}"
+            )
+            VideoRenderer._video_encoder = SOFTWARE_VIDEO_ENCODER
+            encoder = SOFTWARE_VIDEO_ENCODER
+            result = run_ffmpeg(build_cmd(encoder))
+
+        logger.debug(f"{description}: encoder_used={encoder}")
+        return result
+
+    def _get_media_duration(self, path: str, **probe_args) -> float:
+        """
+        Get duration of a media file (or concat list, with f='concat') in seconds.
+
+        Plain files are memoized by (path, mtime, size) in-process on top of
+        the persistent probe cache; probes with extra ffprobe arguments
+        always run.
+        """
         try:
-            probe = ffmpeg.probe(path)
+            if not probe_args:
+                stat = os.stat(path)
+                return _file_duration(path, stat.st_mtime_ns, stat.st_size)
+            probe = ffmpeg.probe(path, **probe_args)
             return float(probe['format']['duration'])
+        except ffmpeg.Error as e:
+            # stderr is raw bytes; decode only the tail, tolerating non-UTF-8 output
+            detail = (e.stderr[-FFPROBE_STDERR_TAIL_BYTES:] if e.stderr else b'').decode('utf-8', errors='replace')
+            logger.warning(f"Could not probe duration for {path}: {detail.strip() or e}")
+            return 0.0
         except Exception as e:
             logger.warning(f"Could not probe duration for {path}: {e}")
             return 0.0
@@ -120,6 +708,7 @@ class VideoRenderer:
         output_path: str,
         duration: float,
         add_ken_burns: bool = True,
+        threads: Optional[int] = None,
     ) -> str:
         """
         Create a video from a static image with optional Ken Burns effect.
@@ -129,54 +718,127 @@ class VideoRenderer:
             output_path: Output path for the generated video
             duration: Duration of the video in seconds
             add_ken_burns: If True, adds subtle zoom effect
+            threads: If specified, cap FFmpeg's worker threads for this encode
 
         Returns:
             Path to the created video
         """
-        # Build the video filter
-        # Scale to fit 9:16 while maintaining aspect ratio, then crop to exact size
-        if add_ken_burns:
-            # Ken Burns: smooth slow zoom from 100% to 105% over the duration
-            # Using linear interpolation based on frame number for smooth motion
-            total_frames = int(duration * FPS)
-            video_filter = (
-                f"loop=loop=-1:size=1:start=0,"
-                f"scale={int(OUTPUT_WIDTH * 1.1)}:{int(OUTPUT_HEIGHT * 1.1)}:force_original_aspect_ratio=increase,"
-                f"crop={OUTPUT_WIDTH}:{OUTPUT_HEIGHT},"
-                f"zoompan=z='1+0.05*on/{total_frames}':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':d={total_frames}:s={OUTPUT_WIDTH}x{OUTPUT_HEIGHT}:fps={FPS},"
-                f"setsar=1"
-            )
-        else:
-            video_filter = (
-                f"loop=loop=-1:size=1:start=0,"
-                f"scale={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:force_original_aspect_ratio=increase,"
-                f"crop={OUTPUT_WIDTH}:{OUTPUT_HEIGHT},"
-                f"setsar=1,fps={FPS}"
-            )
-
-        cmd = [
-            'ffmpeg', '-y',
-            '-loop', '1',
-            '-i', image_path,
-            '-vf', video_filter,
-            '-c:v', 'libx264',
-            '-preset', 'fast',
-            '-crf', '23',
-            '-pix_fmt', 'yuv420p',
-            '-t', str(duration),
-            '-an',  # No audio
-            output_path
-        ]
+        tune = None if add_ken_burns else 'stillimage'
+
+        # Re-runs and repeated posters produce identical clips, so reuse a previous
+        # encode when the image bytes and every setting that shapes the output match
+        stat = os.stat(image_path)
+        image_digest = _file_digest(os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size)
+
+        def cache_path_for(encoder: str) -> Path:
+            settings = " ".join(self._video_encoder_args(encoder, tune=tune))
+            key = hashlib.sha256(
+                f"{image_digest}|{duration:.3f}|{int(add_ken_burns)}|{settings}"
+                f"|{OUTPUT_WIDTH}x{OUTPUT_HEIGHT}@{FPS}".encode("utf-8")
+            ).hexdigest()
+            return Config.IMAGE_CLIP_CACHE_DIR / f"{key}{Path(output_path).suffix}"
+
+        cached_path = cache_path_for(self._get_video_encoder())
+        if cached_path.exists():
+            try:
+                link_or_copy(cached_path, Path(output_path))
+                # Mark the entry as recently used for _prune_image_clip_cache
+                os.utime(cached_path)
+                logger.info(f"Image clip cache hit: {image_path} -> {output_path}")
+                return output_path
+            except OSError as e:
+                logger.warning(f"Ignoring unreadable image clip cache entry {cached_path}: {e}")
+
+        # Round the zoom length up so truncation never leaves the clip a frame
+        # short of -t (zoompan stops emitting after d frames)
+        total_frames = max(1, math.ceil(duration * FPS)) if add_ken_burns else None
+        video_filter = _image_video_filter(total_frames)
+
+        def build_cmd(encoder: str) -> List[str]:
+            return [
+                'ffmpeg', '-y',
+                # Simple -vf chains get their own thread count; keep the
+                # scale/zoompan slices within this worker's share of the cores
+                *_filter_threads_args(threads),
+                '-framerate', str(FPS),
+                '-i', image_path,
+                '-vf', video_filter,
+                # Static posters compress best with stillimage; Ken Burns frames move
+                *self._video_encoder_args(encoder, tune=tune),
+                '-pix_fmt', 'yuv420p',
+                *(['-threads', str(threads)] if threads else []),
+                '-t', str(duration),
+                '-an',  # No audio
+                output_path
+            ]
 
         logger.info(f"Creating video from image: {image_path} -> {output_path} ({duration:.2f}s)")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run_scene_encode(build_cmd, f"image-to-video {Path(image_path).name}")
 
         if result.returncode != 0:
             logger.error(f"FFmpeg image-to-video error: {result.stderr}")
             raise RuntimeError(f"Failed to create video from image: {result.stderr[-500:]}")
 
+        try:
+            # Key on the encoder that actually ran: a hardware failure falls back to libx264
+            cached_path = cache_path_for(self._get_video_encoder())
+            cached_path.parent.mkdir(parents=True, exist_ok=True)
+            link_or_copy(Path(output_path), cached_path)
+            _prune_image_clip_cache()
+        except OSError as e:
+            logger.warning(f"Failed to store image clip cache entry: {e}")
+
         return output_path
 
+    def _encode_parallelism(self, job_count: int, default_workers: int) -> Tuple[int, Optional[int]]:
+        """
+        Size a pool of concurrent FFmpeg encodes.
+
+        Each encode is one FFmpeg process, so the cores are split between the
+        workers rather than letting every encoder spawn a thread per core.
+
+        Args:
+            job_count: Number of encodes to run.
+            default_workers: Worker cap when Config.FFMPEG_MAX_PARALLEL is unset.
+
+        Returns:
+            Tuple of (max_workers, threads per encode or None to let FFmpeg decide).
+        """
+        cpu_count = os.cpu_count() or 2
+        max_workers = min(job_count, Config.FFMPEG_MAX_PARALLEL or default_workers)
+        if self._get_video_encoder() != SOFTWARE_VIDEO_ENCODER:
+            # Consumer GPUs cap concurrent encode sessions
+            max_workers = min(max_workers, HW_MAX_CONCURRENT_ENCODES)
+        max_workers = max(1, max_workers)
+        threads = max(1, cpu_count // max_workers) if max_workers > 1 else None
+        return max_workers, threads
+
+    def _create_poster_videos(self, jobs: List[Tuple[str, str, float]]) -> None:
+        """
+        Render static poster clips concurrently.
+
+        Args:
+            jobs: (image_path, output_path, duration) for each clip.
+        """
+        # Static posters are cheap to encode, so allow one per core by default
+        max_workers, threads = self._encode_parallelism(len(jobs), os.cpu_count() or 2)
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="poster") as executor:
+            futures = [
+                executor.submit(
+                    self._create_video_from_image,
+                    image_path=image_path,
+                    output_path=output_path,
+                    duration=duration,
+                    add_ken_burns=False,  # Posters and the silent ending stay static
+                    threads=threads,
+                )
+                for image_path, output_path, duration in jobs
+            ]
+            # Surface the first failure in scene order
+            for future in futures:
+                future.result()
+
     def render_from_scenes(
         self,
         scene_assets: List["SceneAssets"],
@@ -184,6 +846,7 @@ class VideoRenderer:
         subtitle_path: Optional[str] = None,
         background_music_path: Optional[str] = None,
         music_volume: float = 0.3,
+        target_bitrate: Optional[str] = None,
     ) -> str:
         """
         Renders the final video from a list of SceneAssets.
@@ -198,6 +861,9 @@ class VideoRenderer:
             background_music_path: Path to background music file.
                                    Defaults to assets/audio/background_track.mp3.
             music_volume: Base volume for background music (0.0-1.0).
+            target_bitrate: Optional video bitrate (e.g. '6M'). When set and the
+                            final render re-encodes, libx264 runs two-pass ABR
+                            for a predictable file size instead of single-pass CRF.
 
         Returns:
             Path to the rendered video.
@@ -210,8 +876,10 @@ class VideoRenderer:
         )
 
         try:
-            # Create temporary directory for intermediate files
-            with tempfile.TemporaryDirectory() as temp_dir:
+            # Create temporary directory for intermediate files. The normalized
+            # segments are written once and read once, so keep them off disk
+            # when there is a large enough tmpfs.
+            with tempfile.TemporaryDirectory(dir=_intermediate_temp_dir()) as temp_dir:
                 temp_path = Path(temp_dir)
 
                 # Step 1: Create concat list files for videos and audios
@@ -224,18 +892,24 @@ class VideoRenderer:
 
                 # Collect audio durations for trimming videos to match
                 audio_durations = []
+                # (image_path, output_path, duration) per poster clip, encoded together below
+                poster_jobs: List[Tuple[str, str, float]] = []
+                # (path, duration, is_image) per segment for the fused render
+                video_segments: List[Tuple[str, float, bool]] = []
+
+                # Burning subtitles re-encodes the video anyway, so normalize
+                # inside that encode instead of encoding every clip twice
+                fuse_normalize = bool(
+                    subtitle_path and Path(subtitle_path).exists() and self._check_ass_filter()
+                )
                 with open(video_concat_file, 'w') as vf, open(audio_concat_file, 'w') as af:
                     for i, scene in enumerate(scene_assets):
                         # Check if this scene uses a poster instead of video
                         if hasattr(scene, 'poster_path') and scene.poster_path and Path(scene.poster_path).exists():
-                            # Create a video from the poster image (static, no Ken Burns)
-                            poster_video_path = str(temp_path / f"poster_video_{i}.mp4")
-                            self._create_video_from_image(
-                                image_path=scene.poster_path,
-                                output_path=poster_video_path,
-                                duration=scene.audio_duration,
-                                add_ken_burns=False,
-                            )
+                            # Create a video from the poster image (static, no Ken Burns).
+                            # Matroska: no moov rewrite for a clip that is only re-read once.
+                            poster_video_path = str(temp_path / f"poster_video_{i}.mkv")
+                            poster_jobs.append((scene.poster_path, poster_video_path, scene.audio_duration))
                             video_escaped = poster_video_path.replace("'", "'\\''")
                             logger.info(f"Scene {i}: Using poster as video ({scene.audio_duration:.2f}s)")
 
@@ -243,9 +917,11 @@ class VideoRenderer:
                             if hasattr(scene, 'is_ending_scene') and scene.is_ending_scene:
                                 ending_scene = scene
                                 ending_poster_path = scene.poster_path
+                            video_segments.append((scene.poster_path, scene.audio_duration, True))
                         else:
                             # Use the regular video path
                             video_escaped = scene.video_path.replace("'", "'\\''")
+                            video_segments.append((scene.video_path, scene.audio_duration, False))
 
                         audio_escaped = scene.audio_path.replace("'", "'\\''")
                         vf.write(f"file '{video_escaped}'\n")
@@ -256,40 +932,43 @@ class VideoRenderer:
                 silent_segment_path = None
                 if ending_poster_path and Path(ending_poster_path).exists():
                     logger.info(f"Adding {SILENT_POSTER_DURATION}s silent poster segment at the end")
-                    silent_segment_path = str(temp_path / "silent_poster_segment.mp4")
-                    self._create_video_from_image(
-                        image_path=ending_poster_path,
-                        output_path=silent_segment_path,
-                        duration=SILENT_POSTER_DURATION,
-                        add_ken_burns=False,  # Static for the silent ending
-                    )
+                    silent_segment_path = str(temp_path / "silent_poster_segment.mkv")
+                    poster_jobs.append((ending_poster_path, silent_segment_path, SILENT_POSTER_DURATION))
+                    video_segments.append((ending_poster_path, SILENT_POSTER_DURATION, True))
                     # Append to the concat list
                     with open(video_concat_file, 'a') as vf:
                         silent_escaped = silent_segment_path.replace("'", "'\\''")
                         vf.write(f"file '{silent_escaped}'\n")
                     audio_durations.append(SILENT_POSTER_DURATION)
 
-                # Step 2: Concatenate videos (with normalization and trimming to audio duration)
-                concat_video_path = temp_path / "concat_video.mp4"
-                self._concat_media(
-                    concat_file=str(video_concat_file),
-                    output_path=str(concat_video_path),
-                    media_type="video",
-                    temp_dir=temp_path,
-                    target_durations=audio_durations,
-                )
+                # Every segment, fused or normalized here, is bounded to its target
+                # duration. Probing the concat: URL would not work: each TS segment
+                # restarts its timestamps, so it reports about the last segment's length.
+                video_duration = sum(audio_durations)
 
-                # Step 3: Concatenate audio (voiceovers)
-                concat_voice_path = temp_path / "concat_voice.wav"
-                self._concat_media(
-                    concat_file=str(audio_concat_file),
-                    output_path=str(concat_voice_path),
-                    media_type="audio"
-                )
+                norm_concat_url = None
+                if fuse_normalize:
+                    logger.info(f"Normalizing {len(video_segments)} segments inside the subtitle encode")
+                else:
+                    # Poster clips are independent encodes - run them side by side,
+                    # splitting the cores so workers x threads stays near cpu_count
+                    if poster_jobs:
+                        self._create_poster_videos(poster_jobs)
+
+                    # Step 2: Normalize videos (trimmed to audio duration) into MPEG-TS
+                    # segments. The final render reads them through the concat protocol
+                    # and the voiceover list through the concat demuxer, so no joined
+                    # intermediate is written.
+                    norm_concat_url = self._concat_media(
+                        concat_file=str(video_concat_file),
+                        media_type="video",
+                        temp_dir=temp_path,
+                        target_durations=audio_durations,
+                    )
 
                 # Get durations and validate sync
-                voice_duration = self._get_media_duration(str(concat_voice_path))
-                video_duration = self._get_media_duration(str(concat_video_path))
+                # Scene audio is unchanged between re-renders, so probe (cached) per file
+                voice_duration = sum(self._get_media_duration(scene.audio_path) for scene in scene_assets)
 
                 logger.info(f"Voice duration: {voice_duration:.2f}s, Video duration: {video_duration:.2f}s")
 
@@ -312,13 +991,15 @@ class VideoRenderer:
 
                 # Step 4: Build final render command with all filters
                 self._render_final_with_ducking(
-                    video_path=str(concat_video_path),
-                    voice_path=str(concat_voice_path),
+                    video_path=norm_concat_url,
+                    voice_path=str(audio_concat_file),
                     music_path=background_music_path if has_background_music else None,
                     subtitle_path=subtitle_path,
                     output_path=output_path,
                     duration=total_duration,
                     music_volume=music_volume,
+                    video_segments=video_segments if fuse_normalize else None,
+                    target_bitrate=target_bitrate,
                 )
 
             logger.info(f"Successfully rendered final video: {output_path}")
@@ -327,12 +1008,17 @@ class VideoRenderer:
         except Exception as e:
             logger.error(f"Error rendering from scenes: {e}")
             raise
+        finally:
+            # Once per render, after the temp segments are gone so their
+            # entries are pruned rather than persisted
+            save_probe_cache()
 
     def _normalize_video(
         self,
         input_path: str,
         output_path: str,
         target_duration: Optional[float] = None,
+        threads: Optional[int] = None,
     ) -> None:
         """
         Normalizes a video to consistent format for concatenation.
@@ -346,63 +1032,106 @@ class VideoRenderer:
         If target_duration is specified and the video is shorter, the video
         will be looped using -stream_loop to match the target duration.
 
+        A .ts output_path is written as MPEG-TS (Annex B H.264), which can be
+        byte-concatenated with the concat protocol and stream-copied.
+
         Args:
             input_path: Path to input video.
-            output_path: Path for normalized output.
+            output_path: Path for normalized output (.mp4 or .ts).
             target_duration: If specified, loop/trim video to this exact duration in seconds.
+            threads: If specified, cap FFmpeg's worker threads for this encode.
         """
-        cmd = ['ffmpeg', '-y']
-
-        # If target_duration is specified, use -stream_loop -1 to loop the video
-        # infinitely. This ensures short videos are repeated to match longer audio.
-        # The -t flag will then trim the output to the exact target duration.
-        if target_duration is not None:
-            cmd.extend(['-stream_loop', '-1'])
-
-        cmd.extend([
-            '-i', input_path,
-            '-vf', f'scale={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:force_original_aspect_ratio=increase,crop={OUTPUT_WIDTH}:{OUTPUT_HEIGHT},setsar=1,fps={FPS}',
-            '-c:v', 'libx264',
-            '-preset', 'fast',
-            '-crf', '23',
-            '-pix_fmt', 'yuv420p',
-            '-an',  # Strip audio - we handle audio separately
-            '-r', str(FPS),
-        ])
-
-        # Trim looped video to exact target duration
-        if target_duration is not None:
-            cmd.extend(['-t', str(target_duration)])
-
-        cmd.append(output_path)
+        video_filter = f'scale={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:force_original_aspect_ratio=increase,crop={OUTPUT_WIDTH}:{OUTPUT_HEIGHT},setsar=1,fps={FPS}'
+        try:
+            info = probe_info(input_path)
+            if (info.width, info.height) == (OUTPUT_WIDTH, OUTPUT_HEIGHT) and info.fps == FPS:
+                # Already output-sized at the output rate - skip the scaler and fps filter
+                video_filter = 'setsar=1'
+        except (ffmpeg.Error, OSError, KeyError, ValueError) as e:
+            logger.debug(f"Could not probe {input_path} before normalizing: {e}")
+
+        def build_cmd(encoder: str) -> List[str]:
+            cmd = ['ffmpeg', '-y', *_filter_threads_args(threads), *self._hwaccel_input_args(encoder)]
+
+            # If target_duration is specified, use -stream_loop -1 to loop the video
+            # infinitely. This ensures short videos are repeated to match longer audio.
+            # -t as an input option stops the demuxer at the target duration, so
+            # long clips are not decoded past the cut.
+            if target_duration is not None:
+                cmd.extend(['-stream_loop', '-1', '-t', str(target_duration)])
+
+            cmd.extend([
+                '-i', input_path,
+                '-vf', video_filter,
+                *self._video_encoder_args(encoder),
+                '-pix_fmt', 'yuv420p',
+                '-an',  # Strip audio - we handle audio separately
+                '-r', str(FPS),
+                # Duplicate/drop frames to a constant rate: VFR segments desync
+                # once they are stream-copy concatenated
+                '-fps_mode', 'cfr',
+            ])
+            if threads:
+                cmd.extend(['-threads', str(threads)])
+
+            if output_path.endswith('.ts'):
+                cmd.extend(['-f', 'mpegts'])
+            cmd.append(output_path)
+            return cmd
 
         logger.debug(f"Normalizing video: {input_path}" + (f" (loop+trim to {target_duration:.2f}s)" if target_duration else ""))
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run_scene_encode(build_cmd, f"normalize {Path(input_path).name}")
 
         if result.returncode != 0:
             logger.error(f"FFmpeg normalize stderr: {result.stderr}")
             raise RuntimeError(f"Failed to normalize video: {result.stderr[-500:]}")
 
+        if logger.isEnabledFor(logging.DEBUG):
+            self._check_constant_frame_rate(output_path)
+
+    def _check_constant_frame_rate(self, video_path: str) -> None:
+        """Log a warning if a normalized segment did not come out at a constant FPS."""
+        try:
+            streams = ffmpeg.probe(video_path, select_streams='v')['streams']
+        except (ffmpeg.Error, KeyError) as e:
+            logger.debug(f"Could not verify frame rate of {video_path}: {e}")
+            return
+        expected = f"{FPS}/1"
+        for stream in streams:
+            rates = (stream.get('r_frame_rate'), stream.get('avg_frame_rate'))
+            if any(rate != expected for rate in rates):
+                logger.warning(
+                    f"Normalized segment {video_path} is not {FPS} fps CFR "
+                    f"(r_frame_rate={rates[0]}, avg_frame_rate={rates[1]})"
+                )
+
     def _concat_media(
         self,
         concat_file: str,
-        output_path: str,
+        output_path: Optional[str] = None,
         media_type: str = "video",
         temp_dir: Optional[Path] = None,
         target_durations: Optional[List[float]] = None,
-    ) -> None:
+    ) -> Optional[str]:
         """
-        Concatenates media files using FFmpeg concat demuxer.
+        Prepares media for concatenation.
 
-        For videos, normalizes each input first to ensure consistent format.
+        For videos, normalizes each input to an identical MPEG-TS segment and
+        returns a `concat:a.ts|b.ts|...` protocol URL for them. TS segments
+        join at the byte level and tolerate minor SPS/PPS differences between
+        clips, so the URL can be stream-copied without a joined file. For
+        audio, concatenates into output_path directly.
 
         Args:
             concat_file: Path to the concat list file.
-            output_path: Output path for concatenated media.
+            output_path: Concatenated media (audio only).
             media_type: 'video' or 'audio'.
             temp_dir: Temporary directory for normalized files.
             target_durations: List of target durations for each video (video only).
                               Each video will be trimmed to its corresponding duration.
+
+        Returns:
+            The concat protocol URL of the normalized clips (video), else None.
         """
         if media_type == "video":
             # Read the concat file to get video paths
@@ -419,51 +1148,40 @@ class VideoRenderer:
             if not video_paths:
                 raise RuntimeError("No video files found in concat list")
 
-            # Normalize each video
-            normalized_paths = []
-            for i, video_path in enumerate(video_paths):
-                if temp_dir:
-                    norm_path = str(temp_dir / f"norm_{i}.mp4")
-                else:
-                    norm_path = video_path.replace('.mp4', '_norm.mp4')
-
-                # Get target duration for this video if provided
-                duration = None
-                if target_durations and i < len(target_durations):
-                    duration = target_durations[i]
-
-                logger.info(f"Normalizing video {i+1}/{len(video_paths)}: {Path(video_path).name}" + (f" -> {duration:.2f}s" if duration else ""))
-                self._normalize_video(video_path, norm_path, target_duration=duration)
-                normalized_paths.append(norm_path)
-
-            # Create new concat file with normalized videos
-            norm_concat_file = concat_file.replace('.txt', '_norm.txt')
-            with open(norm_concat_file, 'w') as f:
-                for norm_path in normalized_paths:
-                    escaped_path = norm_path.replace("'", "'\\''")
-                    f.write(f"file '{escaped_path}'\n")
-
-            # Concat normalized videos - can use stream copy since they're all identical format
-            cmd = [
-                'ffmpeg', '-y',
-                '-f', 'concat',
-                '-safe', '0',
-                '-i', norm_concat_file,
-                '-c:v', 'copy',  # Stream copy - no re-encoding needed
-                '-an',
-                output_path
-            ]
-
-            logger.debug(f"Concatenating normalized videos")
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            # Clean up normalized concat file
-            if os.path.exists(norm_concat_file):
-                os.remove(norm_concat_file)
+            # Normalize the videos concurrently, about half as many encodes as
+            # there are cores by default
+            max_workers, threads_per_encode = self._encode_parallelism(
+                len(video_paths), max(1, (os.cpu_count() or 2) // 2)
+            )
 
-            if result.returncode != 0:
-                logger.error(f"FFmpeg concat stderr: {result.stderr}")
-                raise RuntimeError(f"Failed to concatenate video: {result.stderr[-500:]}")
+            normalized_paths = []
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="normalize") as executor:
+                futures = []
+                for i, video_path in enumerate(video_paths):
+                    if temp_dir:
+                        norm_path = str(temp_dir / f"norm_{i}.ts")
+                    else:
+                        norm_path = str(Path(video_path).with_suffix('')) + '_norm.ts'
+
+                    # Get target duration for this video if provided
+                    duration = None
+                    if target_durations and i < len(target_durations):
+                        duration = target_durations[i]
+
+                    logger.info(f"Normalizing video {i+1}/{len(video_paths)}: {Path(video_path).name}" + (f" -> {duration:.2f}s" if duration else ""))
+                    futures.append(executor.submit(
+                        self._normalize_video, video_path, norm_path,
+                        target_duration=duration, threads=threads_per_encode,
+                    ))
+                    normalized_paths.append(norm_path)
+
+                # Surface the first failure in scene order
+                for future in futures:
+                    future.result()
+
+            # The normalized segments share one format, so the consumer can
+            # stream-copy the joined TS without re-encoding
+            return "concat:" + "|".join(normalized_paths)
 
         else:  # audio
             cmd = [
@@ -476,7 +1194,7 @@ class VideoRenderer:
             ]
 
             logger.debug(f"Concatenating audio: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = run_ffmpeg(cmd)
 
             if result.returncode != 0:
                 logger.error(f"FFmpeg concat stderr: {result.stderr}")
@@ -484,13 +1202,15 @@ class VideoRenderer:
 
     def _render_final_with_ducking(
         self,
-        video_path: str,
+        video_path: Optional[str],
         voice_path: str,
         music_path: Optional[str],
         subtitle_path: Optional[str],
         output_path: str,
         duration: float,
         music_volume: float = 0.3,
+        video_segments: Optional[List[Tuple[str, float, bool]]] = None,
+        target_bitrate: Optional[str] = None,
     ) -> None:
         """
         Renders the final video with sidechain compression (audio ducking) and ASS subtitles.
@@ -502,63 +1222,112 @@ class VideoRenderer:
 
         Subtitle Burning:
             - Uses the 'ass' filter instead of drawtext
-            - Video is already normalized to 1080x1920 from _normalize_video
+            - Video is already normalized to 1080x1920 from _normalize_video, or,
+              with video_segments, scaled/cropped/concatenated in this same
+              filter graph so the scene clips are encoded only once
 
         Final Output:
-            - Video: libx264, yuv420p, CRF 23
-            - Audio: AAC, 192kbps
+            - Video: hardware H.264 when available, else libx264 (final_preset, crf),
+              yuv420p when subtitles are burned in,
+              otherwise the concatenated video stream is copied as-is
+            - Audio: AAC, 192kbps, 44.1kHz stereo
 
         Args:
-            video_path: Path to concatenated video (already normalized to 1080x1920).
-            voice_path: Path to concatenated voiceover audio.
+            video_path: concat: protocol URL of normalized scene TS segments
+                        (1080x1920, identical format). Unused with video_segments.
+            voice_path: Concat list of scene voiceover audio.
             music_path: Path to background music (optional).
             subtitle_path: Path to .ass subtitle file (optional).
             output_path: Final output path.
             duration: Total duration in seconds.
             music_volume: Base volume for background music (0.0-1.0).
+            video_segments: (path, duration, is_image) per scene in order. When
+                            given, the raw clips and poster images are inputs
+                            and normalization is fused into the final encode.
+                            Requires burned-in subtitles (a re-encode anyway).
+            target_bitrate: Two-pass libx264 ABR target (e.g. '6M') for the
+                            re-encode; ignored when the video is stream-copied.
         """
-        # Build input list
-        inputs = ['-i', video_path, '-i', voice_path]
-        input_count = 2
+        # Build filter complex
+        filter_parts = []
+
+        if video_segments:
+            # Fused path: every scene is its own input and is normalized in the
+            # graph, so the only encode is this one. Clips are looped and bounded
+            # with input-side -t; posters are decoded once, scaled once and the
+            # frame repeated in the graph. Built per encoder so clip decodes can
+            # pair with the hardware encoder (NVDEC).
+            def segment_inputs(encoder: str) -> List[str]:
+                args = []
+                for path, segment_duration, is_image in video_segments:
+                    if is_image:
+                        args.extend(['-framerate', str(FPS), '-i', path])
+                    else:
+                        args.extend([
+                            *self._hwaccel_input_args(encoder), '-stream_loop', '-1',
+                            '-t', f"{segment_duration:.3f}", '-i', path,
+                        ])
+                return args
+
+            for i, (_, segment_duration, is_image) in enumerate(video_segments):
+                if is_image:
+                    chain = _still_segment_filter(max(1, math.ceil(segment_duration * FPS)))
+                else:
+                    chain = _SEGMENT_NORMALIZE_CHAIN
+                filter_parts.append(f"[{i}:v]{chain}[v{i}]")
+            filter_parts.append(
+                "".join(f"[v{i}]" for i in range(len(video_segments)))
+                + f"concat=n={len(video_segments)}:v=1:a=0[vcat]"
+            )
+            voice_idx = len(video_segments)
+            inputs = ['-f', 'concat', '-safe', '0', '-i', voice_path]
+            video_filter = "[vcat]setsar=1"
+        else:
+            # Video segments and voice concat list are joined in this pass.
+            # Each TS segment restarts its timestamps, so regenerate PTS across the joins.
+            inputs = [
+                '-fflags', '+genpts', '-f', 'mpegts', '-i', video_path,
+                '-f', 'concat', '-safe', '0', '-i', voice_path,
+            ]
+            voice_idx = 1
+            # Video filter: lightweight passthrough since video is already normalized
+            # to 1080x1920 by _normalize_video. Only setsar needed to keep filter graph valid.
+            video_filter = "[0:v]setsar=1"
+        input_count = voice_idx + 1
 
         if music_path:
             inputs.extend(['-i', music_path])
             music_idx = input_count
             input_count += 1
 
-        # Build filter complex
-        filter_parts = []
-
-        # Video filter: lightweight passthrough since video is already normalized
-        # to 1080x1920 by _normalize_video. Only setsar needed to keep filter graph valid.
-        video_filter = "[0:v]setsar=1"
-
         # Check ASS subtitle support (cached)
         use_subtitles = False
         if subtitle_path and Path(subtitle_path).exists():
             use_subtitles = self._check_ass_filter()
 
         if use_subtitles:
-            # Escape path for FFmpeg ass filter
-            # The ass filter requires specific escaping:
-            # 1. Backslash must be escaped first (\ -> \\\\)
-            # 2. Colon, brackets, comma, semicolon need filter escaping
-            escaped_path = subtitle_path
-            # First: escape backslashes (needs 4 backslashes in filter_complex)
-            escaped_path = escaped_path.replace("\\", "\\\\\\\\")
-            # Escape filter special characters
-            escaped_path = escaped_path.replace(":", "\\:")
-            escaped_path = escaped_path.replace("[", "\\[")
-            escaped_path = escaped_path.replace("]", "\\]")
-            escaped_path = escaped_path.replace(",", "\\,")
-            escaped_path = escaped_path.replace(";", "\\;")
+            # Escape path for FFmpeg ass filter: backslashes (4 in filter_complex)
+            # and colon, brackets, comma, semicolon, all in a single pass
+            escaped_path = subtitle_path.translate(_FILTER_PATH_ESCAPES)
             # Use the ass filter (applied after scaling, before encoding)
             video_filter += f",ass='{escaped_path}'"
             logger.info(f"ASS subtitles enabled: {subtitle_path}")
             logger.debug(f"Escaped subtitle path: {escaped_path}")
 
-        video_filter += "[vout]"
-        filter_parts.append(video_filter)
+        if video_segments and not use_subtitles:
+            raise ValueError("video_segments requires burned-in subtitles")
+
+        if use_subtitles:
+            video_filter += "[vout]"
+            filter_parts.append(video_filter)
+            video_map = "[vout]"
+        else:
+            # Nothing to draw - the normalized concat is already in the final
+            # format, so mux it straight through instead of re-encoding
+            video_map = "0:v"
+
+        # Everything before this is the video graph, all the two-pass analysis pass needs
+        video_part_count = len(filter_parts)
 
         # Audio filter: sidechain compression for ducking
         if music_path:
@@ -566,7 +1335,7 @@ class VideoRenderer:
             # - [voice] for final mix
             # - [voice_sc] for sidechain compression key signal
             filter_parts.append(
-                "[1:a]aformat=sample_fmts=fltp:sample_rates=44100:channel_layouts=stereo,"
+                f"[{voice_idx}:a]aformat=sample_fmts=fltp:sample_rates=44100:channel_layouts=stereo,"
                 "asplit=2[voice][voice_sc]"
             )
 
@@ -596,41 +1365,165 @@ class VideoRenderer:
             )
             audio_map = "[mixed_audio]"
         else:
-            # No background music - just use voice
-            filter_parts.append("[1:a]aformat=sample_fmts=fltp:sample_rates=44100:channel_layouts=stereo[aout]")
-            audio_map = "[aout]"
+            # No background music - map the voice straight to the AAC encoder and
+            # let the output -ar/-ac options do the format conversion, so no
+            # audio filter graph is built at all
+            audio_map = f"{voice_idx}:a"
 
         filter_complex = ";\n".join(filter_parts)
-
-        # Build FFmpeg command
-        cmd = ['ffmpeg', '-y']
-        cmd.extend(inputs)
-        cmd.extend([
-            '-filter_complex', filter_complex,
-            '-map', '[vout]',
-            '-map', audio_map,
-            '-c:v', 'libx264',
-            '-preset', 'medium',
-            '-crf', '23',
-            '-pix_fmt', 'yuv420p',
-            '-c:a', 'aac',
-            '-b:a', '192k',
-            '-t', str(duration),
-            '-r', str(FPS),
-            output_path
-        ])
-
-        logger.info(f"Rendering final video with audio ducking and ASS subtitles to: {output_path}")
+        filter_script_paths: List[str] = []
+
+        def graph_args(graph: str) -> List[str]:
+            if not graph:
+                # Stream-copied video and voice-only audio need no filter graph
+                return []
+            if len(graph) > FILTER_SCRIPT_THRESHOLD:
+                with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as script_file:
+                    script_file.write(graph)
+                    filter_script_paths.append(script_file.name)
+                args = ['-filter_complex_script', script_file.name]
+            else:
+                args = ['-filter_complex', graph]
+            # Let slice-threaded filters (scale, overlay, the ASS blend) use
+            # several cores instead of the graph's default thread count
+            return ['-filter_complex_threads', str(max(2, (os.cpu_count() or 2) // 2)), *args]
+
+        filter_args = graph_args(filter_complex)
+
+        def build_cmd(encoder: str, pass_number: Optional[int] = None) -> List[str]:
+            if use_subtitles:
+                # Burning subtitles requires a decode/encode of the video stream
+                if pass_number is not None:
+                    # Both passes share the preset, since x264 requires matching
+                    # frame-type decisions; it already speeds up pass 1 on its own
+                    video_codec_args = [
+                        '-c:v', SOFTWARE_VIDEO_ENCODER, '-preset', self.final_preset,
+                        '-b:v', target_bitrate, '-maxrate', target_bitrate, '-bufsize', _scale_bitrate(target_bitrate, 2),
+                        '-pass', str(pass_number), '-passlogfile', passlog_prefix,
+                    ]
+                elif encoder == SOFTWARE_VIDEO_ENCODER:
+                    video_codec_args = ['-c:v', SOFTWARE_VIDEO_ENCODER, '-preset', self.final_preset, '-crf', str(self.crf)]
+                else:
+                    video_codec_args = self._video_encoder_args(encoder)
+                # This is the only encode in flight, so let it use every core
+                video_codec_args += ['-pix_fmt', 'yuv420p', '-r', str(FPS), '-threads', '0']
+            else:
+                video_codec_args = ['-c:v', 'copy']
+
+            cmd = ['ffmpeg', '-y']
+            if video_segments:
+                cmd.extend(segment_inputs(encoder))
+            cmd.extend(inputs)
+            if pass_number == 1:
+                # Analysis pass: only the x264 stats file is kept, so the audio
+                # chain is left out of the graph entirely
+                cmd.extend([
+                    *analysis_filter_args,
+                    '-map', video_map,
+                    *video_codec_args,
+                    '-an',
+                    '-t', str(duration),
+                    '-f', 'null', os.devnull,
+                ])
+                return cmd
+            cmd.extend([
+                *filter_args,
+                '-map', video_map,
+                '-map', audio_map,
+                *video_codec_args,
+                '-c:a', 'aac',
+                '-b:a', '192k',
+                '-ar', '44100',
+                '-ac', '2',
+                '-t', str(duration),
+                '-movflags', '+faststart', output_path,
+            ])
+            return cmd
+
+        logger.info(
+            f"Rendering final video with audio ducking"
+            f"{' and ASS subtitles' if use_subtitles else ' (video stream copy)'} to: {output_path}"
+        )
         logger.debug(f"Filter complex:\n{filter_complex}")
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        two_pass = bool(use_subtitles and target_bitrate)
+        if target_bitrate and not use_subtitles:
+            logger.info("target_bitrate ignored: the video stream is copied, not encoded")
+        passlog_dir = tempfile.mkdtemp(prefix="x264pass") if two_pass else None
+        passlog_prefix = os.path.join(passlog_dir, "final") if passlog_dir else None
+        analysis_filter_args = (
+            graph_args(";\n".join(filter_parts[:video_part_count])) if two_pass else []
+        )
+
+        try:
+            if two_pass:
+                logger.info(f"Two-pass encode at {target_bitrate}")
+                result = run_ffmpeg(build_cmd(SOFTWARE_VIDEO_ENCODER, pass_number=1))
+                if result.returncode == 0:
+                    result = run_ffmpeg(build_cmd(SOFTWARE_VIDEO_ENCODER, pass_number=2))
+            elif use_subtitles:
+                result = self._run_scene_encode(build_cmd, "final render")
+            else:
+                result = run_ffmpeg(build_cmd(SOFTWARE_VIDEO_ENCODER))
+        finally:
+            for script_path in filter_script_paths:
+                os.unlink(script_path)
+            if passlog_dir:
+                shutil.rmtree(passlog_dir, ignore_errors=True)
 
         if result.returncode != 0:
             logger.error(f"FFmpeg render stderr: {result.stderr}")
             raise RuntimeError(f"Failed to render final video: {result.stderr[-500:]}")
 
 
-def assemble_veo_clips(clip_paths: List[str], output_filepath: str) -> str:
+def _keyframe_times(path: str) -> List[float]:
+    """
+    Timestamps (seconds) of the video keyframes in a file, from packet flags.
+
+    Only packets are read, so nothing is decoded.
+
+    Raises:
+        RuntimeError: If the file has no video keyframes or cannot be probed.
+    """
+    try:
+        probe = ffmpeg.probe(
+            path, select_streams='v:0', show_packets=None, show_entries='packet=pts_time,flags'
+        )
+    except ffmpeg.Error as e:
+        detail = (e.stderr[-FFPROBE_STDERR_TAIL_BYTES:] if e.stderr else b'').decode('utf-8', errors='replace')
+        raise RuntimeError(f"Could not read keyframes of {path}: {detail.strip() or e}") from e
+    times = sorted(
+        float(packet['pts_time']) for packet in probe.get('packets', [])
+        if 'K' in packet.get('flags', '') and packet.get('pts_time') not in (None, 'N/A')
+    )
+    if not times:
+        raise RuntimeError(f"No video keyframes found in {path}")
+    return times
+
+
+def _snap_to_keyframe(keyframes: List[float], inpoint: float) -> Optional[float]:
+    """
+    First keyframe at or after inpoint (within half a frame), or None.
+
+    A stream copy can only start on a keyframe; starting on the next one
+    guarantees nothing before inpoint is kept.
+    """
+    tolerance = 0.5 / FPS
+    return next((t for t in keyframes if t >= inpoint - tolerance), None)
+
+
+def _veo_concat_list(clip_paths: List[str], inpoints: List[Optional[float]]) -> str:
+    """ffconcat 1.0 list for the clips, with an inpoint directive where one is set."""
+    lines = ["ffconcat version 1.0"]
+    for clip, clip_inpoint in zip(clip_paths, inpoints):
+        escaped = clip.replace("'", "'\\''")
+        lines.append(f"file '{escaped}'")
+        if clip_inpoint:
+            lines.append(f"inpoint {clip_inpoint:.6f}")
+    return "\n".join(lines) + "\n"
+
+
+def assemble_veo_clips(clip_paths: List[str], output_filepath: str, inpoint: float = 0.0) -> str:
     """
     Concatenate Veo-generated MP4 clips into a single seamless vertical video.
 
@@ -641,9 +1534,16 @@ def assemble_veo_clips(clip_paths: List[str], output_filepath: str) -> str:
     If clips have mismatched parameters, falls back to re-encoding to ensure
     a valid output.
 
+    A non-zero inpoint trims the start of every clip inside the same
+    stream-copy pass. A copy can only start on a keyframe, so each clip's
+    inpoint is snapped forward to its first keyframe at or after the
+    requested time: no frame before the cut survives, at the cost of up to
+    one GOP more being dropped.
+
     Args:
         clip_paths: Ordered list of MP4 file paths to concatenate.
         output_filepath: Where to save the final assembled MP4.
+        inpoint: Seconds to skip at the start of every clip.
 
     Returns:
         The output_filepath where the assembled video was saved.
@@ -657,13 +1557,22 @@ def assemble_veo_clips(clip_paths: List[str], output_filepath: str) -> str:
 
     Path(output_filepath).parent.mkdir(parents=True, exist_ok=True)
 
+    inpoints: List[Optional[float]] = [None] * len(clip_paths)
+    if inpoint > 0:
+        for i, clip in enumerate(clip_paths):
+            snapped = _snap_to_keyframe(_keyframe_times(clip), inpoint)
+            if snapped is None:
+                raise RuntimeError(f"No keyframe after {inpoint:.2f}s in {clip}; cannot trim it by stream copy")
+            if snapped - inpoint > VEO_MAX_KEYFRAME_SNAP:
+                logger.warning(f"Trim of {Path(clip).name} snapped to keyframe at {snapped:.2f}s")
+            else:
+                logger.debug(f"Trim of {Path(clip).name} snapped to keyframe at {snapped:.3f}s")
+            inpoints[i] = snapped
+
     # Write concat list to a temp file next to the output
     concat_list_path = Path(output_filepath).with_suffix(".concat.txt")
     try:
-        with open(concat_list_path, "w") as f:
-            for clip in clip_paths:
-                escaped = clip.replace("'", "'\\''")
-                f.write(f"file '{escaped}'\n")
+        concat_list_path.write_text(_veo_concat_list(clip_paths, inpoints))
 
         # First attempt: stream copy (fast, no quality loss, preserves audio sync)
         cmd = [
@@ -677,7 +1586,7 @@ def assemble_veo_clips(clip_paths: List[str], output_filepath: str) -> str:
         ]
 
         logger.info(f"Assembling {len(clip_paths)} Veo clips into {output_filepath}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = run_ffmpeg(cmd)
 
         if result.returncode != 0:
             # Fallback: re-encode to handle codec mismatches
@@ -691,7 +1600,7 @@ def assemble_veo_clips(clip_paths: List[str], output_filepath: str) -> str:
                 "-safe", "0",
                 "-i", str(concat_list_path),
                 "-c:v", "libx264",
-                "-preset", "fast",
+                "-preset", Config.X264_PRESET,
                 "-crf", "23",
                 "-pix_fmt", "yuv420p",
                 "-c:a", "aac",
@@ -700,7 +1609,7 @@ def assemble_veo_clips(clip_paths: List[str], output_filepath: str) -> str:
                 "-r", str(FPS),
                 output_filepath,
             ]
-            result2 = subprocess.run(cmd_reencode, capture_output=True, text=True)
+            result2 = run_ffmpeg(cmd_reencode)
             if result2.returncode != 0:
                 logger.error(f"FFmpeg re-encode concat stderr: {result2.stderr}")
                 raise RuntimeError(f"Failed to assemble Veo clips: {result2.stderr[-500:]}")
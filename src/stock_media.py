@@ -9,8 +9,11 @@ Videos are optimized for cinematic quality with 4K enhancement.
 import logging
 import os
 import random
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import requests
 
@@ -30,6 +33,14 @@ MIN_VIDEO_DURATION = 5
 
 # Local fallback video directory
 FALLBACK_VIDEO_DIR = Config.ASSETS_DIR / "basevideos"
+FALLBACK_VIDEO_EXTENSIONS = frozenset({".mp4", ".mov", ".mkv"})
+
+# Copy buffer for streaming stock video downloads to disk (4 MiB)
+DOWNLOAD_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Fallback video -> duration (None if unprobeable), built once per process
+_fallback_index: Optional[Dict[Path, Optional[float]]] = None
+_fallback_index_lock = threading.Lock()
 
 
 class PexelsAPIError(Exception):
@@ -181,10 +192,11 @@ def _download_file(url: str, output_path: Path) -> None:
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Stream the socket straight into the file in large blocks rather than
+    # iterating small chunks in Python
+    response.raw.decode_content = True
     with open(output_path, 'wb') as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            if chunk:
-                f.write(chunk)
+        shutil.copyfileobj(response.raw, f, length=DOWNLOAD_BUFFER_SIZE)
 
 
 def download_video(
@@ -294,6 +306,44 @@ def download_video(
     return _use_local_fallback(queries, failed_queries)
 
 
+def _probe_fallback_duration(path: Path) -> Optional[float]:
+    """Duration of a fallback video via the renderer's persistent probe cache."""
+    from src.renderer import probe_info
+
+    try:
+        return probe_info(str(path)).duration
+    except Exception as e:
+        logger.debug(f"Could not probe fallback video {path.name}: {e}")
+        return None
+
+
+def _get_fallback_index() -> Dict[Path, Optional[float]]:
+    """
+    Lists the fallback videos and their durations once per process.
+
+    The directory is scanned and every file probed (concurrently; ffprobe is
+    blocking I/O) on first use, so later fallbacks do no filesystem or
+    subprocess work. An empty or missing directory is not cached.
+    """
+    global _fallback_index
+    with _fallback_index_lock:
+        if _fallback_index is None and FALLBACK_VIDEO_DIR.exists():
+            # scandir reuses the directory entry's type info, so no stat per file
+            with os.scandir(FALLBACK_VIDEO_DIR) as entries:
+                video_files = sorted(
+                    Path(entry.path) for entry in entries
+                    if entry.is_file() and os.path.splitext(entry.name)[1].lower() in FALLBACK_VIDEO_EXTENSIONS
+                )
+            if video_files:
+                with ThreadPoolExecutor(max_workers=min(8, len(video_files))) as executor:
+                    durations = list(executor.map(_probe_fallback_duration, video_files))
+                _fallback_index = dict(zip(video_files, durations))
+
+                from src.renderer import save_probe_cache
+                save_probe_cache()
+        return _fallback_index or {}
+
+
 def _use_local_fallback(
     queries: List[str],
     failed_queries: List[str]
@@ -319,25 +369,26 @@ def _use_local_fallback(
             f"Please create the directory: {FALLBACK_VIDEO_DIR}"
         )
 
-    # Find all .mp4 files in the fallback directory
-    mp4_files = list(FALLBACK_VIDEO_DIR.glob("*.mp4"))
+    # Find all video files in the fallback directory (indexed once)
+    fallback_index = _get_fallback_index()
+    video_files = list(fallback_index)
 
-    if not mp4_files:
+    if not video_files:
         raise VideoNotFoundError(
             f"Pexels search failed for all queries and no fallback videos found.\n"
             f"Failed queries: {failed_queries}\n"
-            f"Please add .mp4 files to: {FALLBACK_VIDEO_DIR}"
+            f"Please add .mp4/.mov/.mkv files to: {FALLBACK_VIDEO_DIR}"
         )
 
     # Randomly select one fallback video
-    selected_file = random.choice(mp4_files)
+    selected_file = random.choice(video_files)
 
     logger.warning(f"Pexels search failed for all queries. Using local fallback: {selected_file.name}")
 
     metadata = {
         "width": None,
         "height": None,
-        "duration": None,
+        "duration": fallback_index[selected_file],
         "pexels_url": None,
         "photographer": None,
         "queries": queries,
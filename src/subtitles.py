@@ -21,6 +21,13 @@ WHITE_SEMI = Color(255, 255, 255, 40)    # Slightly transparent white for subtit
 BLACK = Color(0, 0, 0, 0)                # &H00000000
 BLACK_SEMI = Color(0, 0, 0, 128)         # &H80000000 (semi-transparent for background box)
 
+# Fixed position at center of 1080p screen (960, 540)
+POSITION_TAG = r"{\pos(960,540)}"
+# Minimum on-screen time per word (ms)
+MIN_WORD_DURATION_MS = 100
+# Stripped from both ends of each word; Whisper words carry a leading space
+WORD_STRIP_CHARS = string.whitespace + string.punctuation
+
 
 def generate_karaoke_subtitles(
     whisper_segments: List[dict],
@@ -188,27 +195,23 @@ def _create_karaoke_events(
     if not word_group:
         return
 
-    # Fixed position at center of 1080p screen (960, 540)
-    position_tag = r"{\pos(960,540)}"
-
+    events = []
     for word_info in word_group:
-        # Calculate timing in milliseconds
+        # Clean word: lowercase, no surrounding whitespace or punctuation
+        clean_word = word_info["word"].lower().strip(WORD_STRIP_CHARS)
+        if not clean_word:
+            # Pure punctuation (e.g. a lone dash) would only add an empty
+            # event for libass to scan on every frame
+            continue
+
+        # Calculate timing in milliseconds, ensuring a minimum duration
         start_ms = int(word_info["start"] * 1000)
-        end_ms = int(word_info["end"] * 1000)
-
-        # Ensure minimum duration of 100ms
-        if end_ms - start_ms < 100:
-            end_ms = start_ms + 100
-
-        # Clean word: lowercase, no punctuation
-        clean_word = word_info["word"].lower().strip(string.punctuation)
-        line_text = position_tag + clean_word
+        end_ms = max(int(word_info["end"] * 1000), start_ms + MIN_WORD_DURATION_MS)
 
-        # Create subtitle event
-        event = SSAEvent(
+        events.append(SSAEvent(
             start=start_ms,
             end=end_ms,
-            text=line_text,
+            text=POSITION_TAG + clean_word,
             style=style_name,
-        )
-        subs.events.append(event)
+        ))
+    subs.events.extend(events)
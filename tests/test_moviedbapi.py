@@ -0,0 +1,39 @@
+import pytest
+
+from src import moviedbapi
+from src.moviedbapi import MovieDBClient, _normalize_query
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(moviedbapi, "_SEARCH_CACHE", {})
+    return MovieDBClient()
+
+
+def test_composed_and_decomposed_spellings_share_a_key():
+    assert _normalize_query("  Amélie ") == _normalize_query("AMÉLIE")
+
+
+def test_tmdb_search_hits_are_cached_by_normalized_query(client, monkeypatch):
+    fetches = []
+
+    def fetch(query):
+        fetches.append(query)
+        return {"id": 194, "title": "Amélie"}
+
+    monkeypatch.setattr(client, "_fetch_tmdb_search", fetch)
+
+    first = client._search_tmdb("Amélie")
+    second = client._search_tmdb("  amélie")
+
+    assert second is first
+    assert fetches == ["Amélie"]
+
+
+def test_tmdb_search_misses_are_not_cached(client, monkeypatch):
+    fetches = []
+    monkeypatch.setattr(client, "_fetch_tmdb_search", lambda query: fetches.append(query))
+
+    assert client._search_tmdb("Nonexistent") is None
+    assert client._search_tmdb("Nonexistent") is None
+    assert len(fetches) == 2
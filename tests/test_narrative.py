@@ -0,0 +1,157 @@
+import os
+import threading
+import time
+
+import pytest
+
+from src import narrative
+from src.config import Config
+from src.narrative import Scene, StoryGenerator, VideoScript
+
+
+def _script(narrations):
+    return VideoScript(
+        title="Heat",
+        genre="thriller",
+        selected_voice_id="Charon",
+        bpm=120,
+        scenes=[
+            Scene(
+                scene_index=i,
+                narration=narration,
+                visual_queries=["city night", "rain", "neon"],
+                visual_style_modifiers=["cinematic lighting"],
+            )
+            for i, narration in enumerate(narrations)
+        ],
+    )
+
+
+def test_hook_context_joins_the_first_two_narrations_without_changing_the_schema():
+    script = _script(["One.", "Two.", "Three.", "Four.", "Five.", "Six."])
+
+    assert script.hook_context == "One. Two."
+    assert "hook_context" not in script.model_dump()
+    assert "hook_context" not in VideoScript.model_json_schema()["properties"]
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    monkeypatch.setattr(narrative, "_get_gemini_client", lambda: None)
+    monkeypatch.setattr(narrative, "_get_groq_client", lambda: None)
+    story_generator = StoryGenerator(log_dir=tmp_path / "logs", cache_dir=tmp_path / "cache")
+    yield story_generator
+    story_generator.close()
+
+
+def test_slow_gemini_is_raced_by_groq_and_muted_once_groq_wins(generator, monkeypatch):
+    monkeypatch.setattr(Config, "GROQ_API_KEY", "test-key")
+    monkeypatch.setattr(Config, "LLM_HEDGE_DELAY", 0.01)
+    release_gemini = threading.Event()
+    gemini_done = threading.Event()
+    script = _script(["One.", "Two.", "Three.", "Four.", "Five.", "Six."])
+
+    def generate_validated(provider, system_prompt, user_prompt, callback=None):
+        if provider == "groq":
+            return "{}", script
+        release_gemini.wait(5)
+        if callback:
+            callback("log", "late gemini chunk")
+        gemini_done.set()
+        return "{}", script
+
+    monkeypatch.setattr(generator, "_generate_validated", generate_validated)
+    messages = []
+
+    _content, result, provider = generator._generate_content(
+        "system", "user", callback=lambda kind, message: messages.append(message)
+    )
+    release_gemini.set()
+    gemini_done.wait(5)
+
+    assert provider == "groq"
+    assert result is script
+    assert "late gemini chunk" not in messages
+
+
+def test_failed_gemini_falls_back_to_groq_immediately(generator, monkeypatch):
+    monkeypatch.setattr(Config, "GROQ_API_KEY", "test-key")
+    monkeypatch.setattr(Config, "LLM_HEDGE_DELAY", 60.0)
+    script = _script(["One.", "Two.", "Three.", "Four.", "Five.", "Six."])
+    calls = []
+
+    def generate_validated(provider, system_prompt, user_prompt, callback=None):
+        calls.append(provider)
+        if provider == "gemini":
+            raise ValueError("gemini returned an empty response")
+        return "{}", script
+
+    monkeypatch.setattr(generator, "_generate_validated", generate_validated)
+
+    assert generator._generate_content("system", "user")[2] == "groq"
+    assert calls == ["gemini", "groq"]
+
+
+def test_both_providers_failing_raises(generator, monkeypatch):
+    monkeypatch.setattr(Config, "GROQ_API_KEY", "test-key")
+    monkeypatch.setattr(Config, "LLM_HEDGE_DELAY", 0.01)
+
+    def generate_validated(provider, system_prompt, user_prompt, callback=None):
+        raise ValueError(f"{provider} down")
+
+    monkeypatch.setattr(generator, "_generate_validated", generate_validated)
+
+    with pytest.raises(RuntimeError, match="Both Gemini and Groq failed"):
+        generator._generate_content("system", "user")
+
+
+PLOT = " ".join(f"word{i}" for i in range(40))
+
+
+def test_cached_script_is_served_until_its_ttl_expires(generator):
+    script = _script(["One.", "Two.", "Three.", "Four.", "Five.", "Six."])
+    key = generator.script_cache_key("Heat", PLOT)
+    generator._store_cached_script(key, script, "Heat", PLOT)
+
+    assert generator._load_cached_script(key) == script
+
+    expired = time.time() - StoryGenerator.SCRIPT_CACHE_TTL_SECONDS - 60
+    os.utime(generator._cache_path(key), (expired, expired))
+
+    assert generator._load_cached_script(key) is None
+
+
+def test_near_duplicate_plot_reuses_the_cached_script_for_the_same_title(generator, tmp_path):
+    script = _script(["One.", "Two.", "Three.", "Four.", "Five.", "Six."])
+    key = generator.script_cache_key("Heat", PLOT)
+    generator._store_cached_script(key, script, "Heat", PLOT)
+    edited_plot = "  " + PLOT.replace("word0", "other")
+
+    assert generator.script_cache_key("Heat", edited_plot) != key
+    assert generator._find_similar_script("  heat ", edited_plot) == script
+    assert generator._find_similar_script("Ronin", edited_plot) is None
+
+    # A fresh generator rebuilds the index from the on-disk sidecars
+    fresh = StoryGenerator(log_dir=tmp_path / "logs", cache_dir=tmp_path / "cache")
+    try:
+        assert fresh._find_similar_script("Heat", edited_plot) == script
+    finally:
+        fresh.close()
+
+
+def test_unrelated_plot_misses_the_similarity_cache(generator):
+    script = _script(["One.", "Two.", "Three.", "Four.", "Five.", "Six."])
+    generator._store_cached_script(generator.script_cache_key("Heat", PLOT), script, "Heat", PLOT)
+
+    assert generator._find_similar_script("Heat", "a completely different story") is None
+
+
+def test_invalidate_removes_the_entry_and_its_similarity_match(generator):
+    script = _script(["One.", "Two.", "Three.", "Four.", "Five.", "Six."])
+    key = generator.script_cache_key("Heat", PLOT)
+    generator._store_cached_script(key, script, "Heat", PLOT)
+
+    assert generator.invalidate(key) is True
+    assert generator._load_cached_script(key) is None
+    assert generator._find_similar_script("Heat", PLOT) is None
+    assert generator.invalidate(key) is False
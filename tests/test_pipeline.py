@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+
+from src.pipeline import _split_segments_by_scene
+
+
+def _word(text, start, end):
+    return SimpleNamespace(word=text, start=start, end=end)
+
+
+def test_segment_straddling_a_scene_boundary_is_split_between_scenes():
+    segment = SimpleNamespace(
+        text=" Hello world",
+        start=1.5,
+        end=2.5,
+        words=[_word(" Hello", 1.5, 1.75), _word(" world", 2.25, 2.5)],
+    )
+
+    per_scene = _split_segments_by_scene([segment], [0.0, 2.0])
+
+    assert per_scene == [
+        [{"text": " Hello", "start": 1.5, "end": 1.75,
+          "words": [{"word": " Hello", "start": 1.5, "end": 1.75}]}],
+        [{"text": " world", "start": 0.25, "end": 0.5,
+          "words": [{"word": " world", "start": 0.25, "end": 0.5}]}],
+    ]
+
+
+def test_segment_without_words_goes_to_the_scene_it_starts_in():
+    segment = SimpleNamespace(text=" Hi", start=2.5, end=3.0, words=None)
+
+    per_scene = _split_segments_by_scene([segment], [0.0, 2.0])
+
+    assert per_scene == [[], [{"text": " Hi", "start": 0.5, "end": 1.0, "words": []}]]
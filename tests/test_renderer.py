@@ -0,0 +1,169 @@
+import os
+import time
+
+import orjson
+import pytest
+
+from src import renderer
+from src.config import Config
+from src.renderer import (
+    FPS,
+    OUTPUT_HEIGHT,
+    OUTPUT_WIDTH,
+    _filter_threads_args,
+    _image_video_filter,
+    _prune_image_clip_cache,
+    _scale_bitrate,
+    _snap_to_keyframe,
+    _still_segment_filter,
+    _veo_concat_list,
+    cached_probe,
+    save_probe_cache,
+)
+
+
+def test_snap_to_keyframe_moves_forward_to_next_keyframe():
+    assert _snap_to_keyframe([0.0, 1.0, 2.0], 0.2) == 1.0
+
+
+def test_snap_to_keyframe_keeps_a_keyframe_within_half_a_frame():
+    assert _snap_to_keyframe([0.0, 0.2 - 0.4 / FPS, 1.0], 0.2) == 0.2 - 0.4 / FPS
+
+
+def test_snap_to_keyframe_returns_none_past_the_last_keyframe():
+    assert _snap_to_keyframe([0.0, 1.0], 1.5) is None
+
+
+def test_veo_concat_list_writes_inpoints_only_where_set():
+    text = _veo_concat_list(["/clips/a.mp4", "/clips/it's.mp4"], [1.0, None])
+
+    assert text == (
+        "ffconcat version 1.0\n"
+        "file '/clips/a.mp4'\n"
+        "inpoint 1.000000\n"
+        "file '/clips/it'\\''s.mp4'\n"
+    )
+
+
+def test_filter_threads_args_uses_the_worker_share():
+    assert _filter_threads_args(3) == ['-filter_threads', '3']
+
+
+def test_filter_threads_args_without_a_share_uses_at_least_two_threads(monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 1)
+
+    assert _filter_threads_args(None) == ['-filter_threads', '2']
+
+
+@pytest.fixture
+def probe_cache_file(tmp_path, monkeypatch):
+    cache_file = tmp_path / "probe_cache.json"
+    monkeypatch.setattr(Config, "PROBE_CACHE_FILE", cache_file)
+    monkeypatch.setattr(renderer, "_probe_cache", None)
+    monkeypatch.setattr(renderer, "_probe_cache_dirty", False)
+    return cache_file
+
+
+def test_cached_probe_persists_results_across_processes(tmp_path, probe_cache_file, monkeypatch):
+    media = tmp_path / "scene.wav"
+    media.write_bytes(b"audio")
+    probes = []
+    monkeypatch.setattr(renderer.ffmpeg, "probe", lambda path: probes.append(path) or {"format": {}})
+
+    cached_probe(str(media))
+    cached_probe(str(media))
+    save_probe_cache()
+    # A new process starts with nothing loaded
+    monkeypatch.setattr(renderer, "_probe_cache", None)
+
+    assert cached_probe(str(media)) == {"format": {}}
+    assert probes == [str(media)]
+    assert probe_cache_file.exists()
+
+
+def test_cached_probe_reprobes_a_changed_file(tmp_path, probe_cache_file, monkeypatch):
+    media = tmp_path / "scene.wav"
+    media.write_bytes(b"audio")
+    probes = []
+    monkeypatch.setattr(renderer.ffmpeg, "probe", lambda path: probes.append(path) or {})
+
+    cached_probe(str(media))
+    media.write_bytes(b"longer audio")
+    cached_probe(str(media))
+
+    assert len(probes) == 2
+
+
+def test_save_probe_cache_drops_missing_files_and_keeps_the_newest(tmp_path, probe_cache_file, monkeypatch):
+    monkeypatch.setattr(renderer.ffmpeg, "probe", lambda path: {"path": path})
+    monkeypatch.setattr(renderer, "PROBE_CACHE_MAX_ENTRIES", 1)
+    paths = []
+    for name in ("gone.wav", "old.wav", "new.wav"):
+        media = tmp_path / name
+        media.write_bytes(b"audio")
+        cached_probe(str(media))
+        paths.append(str(media))
+    os.unlink(paths[0])
+
+    save_probe_cache()
+
+    assert [entry["path"] for entry in orjson.loads(probe_cache_file.read_bytes())] == [paths[2]]
+
+
+def _aged_clip(directory, name, age_seconds):
+    clip = directory / name
+    clip.write_bytes(b"x" * 6)
+    mtime = time.time() - age_seconds
+    os.utime(clip, (mtime, mtime))
+    return clip
+
+
+def test_image_clip_cache_evicts_expired_then_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "IMAGE_CLIP_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(renderer, "IMAGE_CLIP_CACHE_MAX_BYTES", 10)
+    expired = _aged_clip(tmp_path, "expired.mp4", renderer.IMAGE_CLIP_CACHE_MAX_AGE + 60)
+    older = _aged_clip(tmp_path, "older.mp4", 120)
+    newest = _aged_clip(tmp_path, "newest.mp4", 60)
+
+    _prune_image_clip_cache()
+
+    assert not expired.exists()
+    assert not older.exists()
+    assert newest.exists()
+
+
+def test_image_clip_cache_within_budget_is_left_alone(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "IMAGE_CLIP_CACHE_DIR", tmp_path)
+    clips = [_aged_clip(tmp_path, f"{i}.mp4", 60) for i in range(3)]
+
+    _prune_image_clip_cache()
+
+    assert all(clip.exists() for clip in clips)
+
+
+def test_static_image_filter_scales_once_then_repeats_the_frame():
+    video_filter = _image_video_filter(None)
+
+    assert "zoompan" not in video_filter
+    assert video_filter.index("scale=") < video_filter.index("loop=loop=-1:size=1")
+
+
+def test_ken_burns_filter_zooms_an_overscanned_still_for_exactly_the_scene_frames():
+    video_filter = _image_video_filter(90)
+
+    assert video_filter.startswith(f"scale={int(OUTPUT_WIDTH * renderer.KEN_BURNS_OVERSCAN)}:")
+    assert f":d=90:s={OUTPUT_WIDTH}x{OUTPUT_HEIGHT}:fps={FPS}" in video_filter
+    assert _image_video_filter(90) is video_filter
+
+
+def test_still_segment_filter_emits_exactly_the_segment_frames_at_the_output_rate():
+    segment_filter = _still_segment_filter(90)
+
+    assert segment_filter.index("scale=") < segment_filter.index("loop=loop=89:size=1:start=0")
+    assert segment_filter.endswith(f"setpts=N/({FPS}*TB)")
+
+
+def test_scale_bitrate_keeps_the_unit_suffix():
+    assert _scale_bitrate("6M", 1.5) == "9M"
+    assert _scale_bitrate("2500k", 2) == "5000k"
+    assert _scale_bitrate("3M", 0.5) == "1.5M"
@@ -0,0 +1,16 @@
+from pysubs2 import SSAFile
+
+from src.subtitles import POSITION_TAG, _create_karaoke_events
+
+
+def test_punctuation_only_words_with_leading_space_are_skipped():
+    subs = SSAFile()
+    words = [
+        {"word": " -", "start": 0.0, "end": 0.2},
+        {"word": " Hello,", "start": 0.2, "end": 0.6},
+        {"word": " ...", "start": 0.6, "end": 0.8},
+    ]
+
+    _create_karaoke_events(subs, words, "Default")
+
+    assert [event.text for event in subs.events] == [POSITION_TAG + "hello"]